@@ -13,3 +13,11 @@ DEFAULT_INSURANCE_PLAN = "none"
 
 DB_DIR_NAME = "data"  # Local data folder
 DB_FILE_NAME = "app.db"  # SQLite file name
+
+SHARDED_STORAGE = False  # One SQLite file per car location (env: CAR_RENTAL_SHARDED=1)
+SNAPSHOT_INTERVAL_SECONDS = 0  # Read-replica refresh period; 0 = off (env: CAR_RENTAL_SNAPSHOT_INTERVAL)
+SLOW_QUERY_MS = 200  # Slow-query log threshold (env: CAR_RENTAL_SLOW_QUERY_MS)
+AUDIT_RETENTION_DAYS = 365  # Older audit rows are archived to data/audit_archive/; 0 = keep all
+USER_CACHE_TTL_SECONDS = 60  # Login/user lookup cache lifetime; 0 = disabled
+USER_CACHE_MAX_ENTRIES = 1024
+SESSION_TTL_SECONDS = 8 * 60 * 60  # Session token lifetime
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from uuid import uuid4
 
+from src.config import SNAPSHOT_INTERVAL_SECONDS
 from src.models.user import User, UserRole, UserStatus
-from src.repositories import user_repo
-from src.repositories.sqlite_base import init_db
+from src.repositories import audit_repo, outbox_repo, user_repo
+from src.repositories.sqlite_base import init_db, start_snapshots
 from src.ui import cli
 
 
@@ -18,9 +20,19 @@ def main() -> None:
     # Bootstraps database and default admin, then runs CLI loop.
     init_db()
     _ensure_default_admin()
+    audit_repo.compact()  # Archive audit rows past the retention window.
+    outbox_repo.prune_consumed()  # Drop booking events every consumer has processed.
+    _start_snapshots()
     cli.main()
 
 
+def _start_snapshots() -> None:
+    # Optional read replica for reporting/listing queries (0 = disabled).
+    interval = float(os.getenv("CAR_RENTAL_SNAPSHOT_INTERVAL", SNAPSHOT_INTERVAL_SECONDS))
+    if interval > 0:
+        start_snapshots(interval)
+
+
 def _ensure_default_admin() -> None:
     existing = user_repo.get_user_by_email(_DEFAULT_ADMIN_EMAIL)
     if existing is not None:
@@ -0,0 +1,61 @@
+"""Audit log entry model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
+import json
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class AuditEntry:
+    id: int
+    actor_id: Optional[str]
+    action: str
+    target_type: str
+    target_id: str
+    detail_json: Optional[str]
+    created_at: datetime
+
+    @cached_property
+    def detail(self) -> Dict[str, Any]:
+        # Decoded on first access only; most listings never look at the detail.
+        if not self.detail_json:
+            return {}
+        try:
+            parsed = json.loads(self.detail_json)
+        except json.JSONDecodeError:
+            return {"raw": self.detail_json}
+        return parsed if isinstance(parsed, dict) else {"value": parsed}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "actor_id": self.actor_id,
+            "action": self.action,
+            "target_type": self.target_type,
+            "target_id": self.target_id,
+            "detail": self.detail_json,
+            "created_at": self.created_at.isoformat().replace("+00:00", "Z"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditEntry":
+        return cls(
+            id=int(data["id"]),
+            actor_id=data.get("actor_id"),
+            action=data["action"],
+            target_type=data["target_type"],
+            target_id=data["target_id"],
+            detail_json=data.get("detail"),
+            created_at=_parse_datetime(data["created_at"]),
+        )
+
+
+def _parse_datetime(value: str) -> datetime:
+    dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
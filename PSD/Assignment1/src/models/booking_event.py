@@ -0,0 +1,63 @@
+"""Booking outbox event model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.models.booking import BookingStatus
+
+
+@dataclass(frozen=True)
+class BookingEvent:
+    id: int
+    # Database the event was read from (None = main database).
+    shard: Optional[str]
+    booking_id: UUID
+    user_id: UUID
+    car_id: UUID
+    event_type: str
+    status: BookingStatus
+    total_estimated: Decimal
+    total_final: Optional[Decimal]
+    created_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "shard": self.shard,
+            "booking_id": str(self.booking_id),
+            "user_id": str(self.user_id),
+            "car_id": str(self.car_id),
+            "event_type": self.event_type,
+            "status": self.status.value,
+            "total_estimated": str(self.total_estimated),
+            "total_final": str(self.total_final) if self.total_final is not None else None,
+            "created_at": self.created_at.isoformat().replace("+00:00", "Z"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BookingEvent":
+        total_final = data.get("total_final")
+        return cls(
+            id=int(data["id"]),
+            shard=data.get("shard"),
+            booking_id=UUID(data["booking_id"]),
+            user_id=UUID(data["user_id"]),
+            car_id=UUID(data["car_id"]),
+            event_type=data["event_type"],
+            status=BookingStatus(data["status"]),
+            total_estimated=Decimal(str(data["total_estimated"])),
+            total_final=Decimal(str(total_final)) if total_final is not None else None,
+            created_at=_parse_datetime(data["created_at"]),
+        )
+
+
+def _parse_datetime(value: str) -> datetime:
+    dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
@@ -0,0 +1,23 @@
+"""Login session model (held in memory, never persisted)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.models.user import UserRole
+
+
+@dataclass(frozen=True)
+class Session:
+    token: str
+    user_id: UUID
+    # Role claim captured at login so authorization needs no user lookup.
+    role: UserRole
+    name: str
+    issued_at: datetime
+    expires_at: datetime
+
+    def is_expired(self, now: datetime) -> bool:
+        return now >= self.expires_at
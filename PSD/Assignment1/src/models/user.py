@@ -81,6 +81,11 @@ class User:
         return user
 
 
+def normalize_email(email: str) -> str:
+    # Case-folded form used for lookups and the uniqueness check.
+    return email.strip().lower()
+
+
 def _ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
@@ -2,25 +2,51 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from src.repositories.sqlite_base import execute, init_db, query
+from src.config import AUDIT_RETENTION_DAYS
+from src.models.audit import AuditEntry
+from src.repositories import statements
+from src.repositories.sqlite_base import db_path, execute, executemany, init_db, query
 
 # Audit log storage only; business logic decides when to log.
+#
+# audit_logs is a rolling table: compact() moves rows older than the retention
+# window into one gzip-compressed JSON Lines file per month and deletes them.
+
+_ARCHIVE_DIR_NAME = "audit_archive"
+_COMPACT_BATCH_SIZE = 5000
+
+_SQL_INSERT = statements.register(
+    "audit.log",
+    """
+    INSERT INTO audit_logs (
+        actor_id, action, target_type, target_id, detail, created_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?
+    )
+    """,
+)
+_SQL_LIST_RECENT = statements.register(
+    "audit.list_recent", "SELECT * FROM audit_logs ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+_SQL_SELECT_EXPIRED = statements.register(
+    "audit.select_expired",
+    "SELECT * FROM audit_logs WHERE created_at < ? ORDER BY created_at ASC, id ASC LIMIT ?",
+)
+_SQL_DELETE_BY_ID = statements.register("audit.delete_by_id", "DELETE FROM audit_logs WHERE id = ?")
 
 
 def log(actor_user_id: UUID, action: str, entity: str, entity_id: UUID, detail_json: str) -> None:
     init_db()
     execute(
-        """
-        INSERT INTO audit_logs (
-            actor_id, action, target_type, target_id, detail, created_at
-        ) VALUES (
-            ?, ?, ?, ?, ?, ?
-        )
-        """,
+        _SQL_INSERT,
         (
             str(actor_user_id),
             action,
@@ -32,11 +58,173 @@ def log(actor_user_id: UUID, action: str, entity: str, entity_id: UUID, detail_j
     )
 
 
-def list_recent(limit: int = 50) -> List[Dict[str, object]]:
+def list_recent(limit: int = 50, use_replica: bool = False) -> List[Dict[str, object]]:
     init_db()
-    rows = query("SELECT * FROM audit_logs ORDER BY created_at DESC LIMIT ?", (int(limit),))
+    rows = query(
+        _SQL_LIST_RECENT,
+        (int(limit),),
+        use_replica=use_replica,
+    )
     return [dict(row) for row in rows]
 
 
+def find(
+    actor_id: Optional[UUID] = None,
+    action: Optional[str] = None,
+    target_type: Optional[str] = None,
+    target_id: Optional[UUID | str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    use_replica: bool = False,
+) -> Tuple[List[AuditEntry], Optional[str]]:
+    """Filtered audit query, newest first; returns (entries, next_cursor).
+
+    Pass next_cursor back as cursor to fetch the following page (keyset
+    pagination, so deep pages cost the same as the first one). since is
+    inclusive and until exclusive.
+    """
+    if target_id is not None and target_type is None:
+        raise ValueError("target_id requires target_type")
+    filters: List[Tuple[str, object]] = []
+    if actor_id is not None:
+        filters.append(("actor_id = ?", str(actor_id)))
+    if action is not None:
+        filters.append(("action = ?", action))
+    if target_type is not None:
+        filters.append(("target_type = ?", target_type))
+    if target_id is not None:
+        filters.append(("target_id = ?", str(target_id)))
+    if since is not None:
+        filters.append(("created_at >= ?", _to_iso_utc(since)))
+    if until is not None:
+        filters.append(("created_at < ?", _to_iso_utc(until)))
+
+    clauses = [clause for clause, _ in filters]
+    params: List[object] = [value for _, value in filters]
+    if cursor is not None:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+        params.extend([cursor_created_at, cursor_created_at, cursor_id])
+    sql = _find_sql(clauses, cursor is not None)
+    params.append(int(limit) + 1)
+
+    init_db()
+    rows = query(sql, params, use_replica=use_replica)
+    entries = [AuditEntry.from_dict(dict(row)) for row in rows[: int(limit)]]
+    next_cursor = None
+    if len(rows) > int(limit) and entries:
+        last = rows[int(limit) - 1]
+        next_cursor = f"{last['created_at']}|{last['id']}"
+    return entries, next_cursor
+
+
+def history(target_type: str, target_id: UUID | str, use_replica: bool = False) -> List[AuditEntry]:
+    """Full audit trail for one entity (e.g. a booking), oldest first."""
+    entries: List[AuditEntry] = []
+    cursor: Optional[str] = None
+    while True:
+        page, cursor = find(
+            target_type=target_type,
+            target_id=target_id,
+            limit=500,
+            cursor=cursor,
+            use_replica=use_replica,
+        )
+        entries.extend(page)
+        if cursor is None:
+            break
+    entries.reverse()
+    return entries
+
+
+def compact(retention_days: Optional[int] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+    """Archive rows older than the retention window; return rows archived per month."""
+    days = AUDIT_RETENTION_DAYS if retention_days is None else int(retention_days)
+    if days <= 0:
+        return {}
+    init_db()
+    current = now or datetime.now(timezone.utc)
+    cutoff = (current - timedelta(days=days)).isoformat().replace("+00:00", "Z")
+    archived: Dict[str, int] = {}
+    while True:
+        rows = [dict(row) for row in query(_SQL_SELECT_EXPIRED, (cutoff, _COMPACT_BATCH_SIZE))]
+        if not rows:
+            return archived
+        # Write the archive before deleting: a crash can duplicate archived rows but never lose them.
+        for month, month_rows in _group_by_month(rows).items():
+            _append_archive(month, month_rows)
+            archived[month] = archived.get(month, 0) + len(month_rows)
+        executemany(_SQL_DELETE_BY_ID, [(row["id"],) for row in rows])
+
+
+def archive_dir() -> Path:
+    return db_path().parent / _ARCHIVE_DIR_NAME
+
+
+def list_archived_months() -> List[str]:
+    directory = archive_dir()
+    if not directory.is_dir():
+        return []
+    prefix, suffix = "audit_logs-", ".jsonl.gz"
+    return sorted(path.name[len(prefix) : -len(suffix)] for path in directory.glob(f"{prefix}*{suffix}"))
+
+
+def read_archive(month: str) -> Iterator[Dict[str, object]]:
+    """Stream archived rows for a month (YYYY-MM) in their original order."""
+    path = _archive_path(month)
+    if not path.exists():
+        return
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _find_sql(clauses: List[str], paged: bool) -> str:
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+    sql = f"SELECT * FROM audit_logs {where}ORDER BY created_at DESC, id DESC LIMIT ?"
+    # One registered statement per filter combination, so stats stay per query shape.
+    filter_clauses = clauses[:-1] if paged else clauses
+    shape = "+".join(clause.split(" ")[0] + clause.split(" ")[1] for clause in filter_clauses) or "all"
+    return statements.register(f"audit.find[{shape}{',paged' if paged else ''}]", sql)
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    created_at, sep, row_id = cursor.rpartition("|")
+    if not sep or not created_at or not row_id.isdigit():
+        raise ValueError("invalid audit cursor")
+    return created_at, int(row_id)
+
+
+def _to_iso_utc(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _group_by_month(rows: List[Dict[str, object]]) -> Dict[str, List[Dict[str, object]]]:
+    groups: Dict[str, List[Dict[str, object]]] = {}
+    for row in rows:
+        groups.setdefault(str(row["created_at"])[:7], []).append(row)
+    return groups
+
+
+def _append_archive(month: str, rows: List[Dict[str, object]]) -> None:
+    path = _archive_path(month)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Appending adds a new gzip member; gzip readers treat the file as one stream.
+    with gzip.open(path, "at", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=True) + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _archive_path(month: str) -> Path:
+    return archive_dir() / f"audit_logs-{month}.jsonl.gz"
+
+
 def _now_iso_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -8,122 +8,206 @@ from typing import List, Optional
 from uuid import UUID
 
 from src.models.booking import Booking
-from src.repositories.sqlite_base import execute, init_db, query
+from src.repositories import sharding, statements
+from src.repositories.sqlite_base import execute, execute_all, init_db, query
 
 # Repository layer: SQL CRUD only, no business rules.
+# create() and update_status() also append a booking_events row in the same
+# transaction (transactional outbox, read through outbox_repo).
+
+EVENT_CREATED = "booking_created"
+EVENT_STATUS_CHANGED = "booking_status_changed"
+
+_SQL_INSERT = statements.register(
+    "booking.create",
+    """
+    INSERT INTO bookings (
+        id, user_id, car_id, start_date, end_date, status, pickup_time, return_time,
+        base_daily_rate, addons, insurance_plan, insurance_daily_fee, late_fee_per_day,
+        total_estimated, total_final, created_at, updated_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    """,
+)
+_SQL_GET_BY_ID = statements.register("booking.get_by_id", "SELECT * FROM bookings WHERE id = ?")
+_SQL_LIST_BY_USER = statements.register(
+    "booking.list_by_user", "SELECT * FROM bookings WHERE user_id = ? ORDER BY created_at ASC"
+)
+_SQL_LIST_PENDING = statements.register(
+    "booking.list_pending", "SELECT * FROM bookings WHERE status = 'pending' ORDER BY created_at ASC"
+)
+_SQL_LIST_BY_CAR = statements.register(
+    "booking.list_by_car", "SELECT * FROM bookings WHERE car_id = ? ORDER BY created_at ASC"
+)
+_SQL_UPDATE_STATUS = statements.register(
+    "booking.update_status", "UPDATE bookings SET status = ?, updated_at = ? WHERE id = ?"
+)
+_SQL_SET_PICKUP_TIME = statements.register(
+    "booking.set_pickup_time", "UPDATE bookings SET pickup_time = ?, updated_at = ? WHERE id = ?"
+)
+_SQL_SET_RETURN_TIME = statements.register(
+    "booking.set_return_time", "UPDATE bookings SET return_time = ?, updated_at = ? WHERE id = ?"
+)
+_SQL_SET_TOTALS = statements.register(
+    "booking.set_totals",
+    """
+    UPDATE bookings
+    SET total_estimated = ?, total_final = ?, updated_at = ?
+    WHERE id = ?
+    """,
+)
+# Snapshots the row as written, so the event carries the new status and totals.
+_SQL_APPEND_EVENT = statements.register(
+    "booking.append_event",
+    """
+    INSERT INTO booking_events (
+        booking_id, user_id, car_id, event_type, status, total_estimated, total_final, created_at
+    )
+    SELECT id, user_id, car_id, ?, status, total_estimated, total_final, updated_at
+    FROM bookings
+    WHERE id = ?
+    """,
+)
+# Overlap rule: NOT (new_end <= existing_start OR new_start >= existing_end)
+_SQL_CHECK_OVERLAP = statements.register(
+    "booking.check_overlap",
+    """
+    SELECT 1 FROM bookings
+    WHERE car_id = ?
+      AND status IN ('approved', 'active', 'overdue')
+      AND NOT (? <= start_date OR ? >= end_date)
+    LIMIT 1
+    """,
+)
 
 
 def create(booking: Booking) -> Booking:
-    init_db()
+    # Bookings live in the same shard as their car.
+    shard = sharding.shard_for_car(booking.car_id)
+    init_db(shard)
+    sharding.register_booking(booking.id, shard)
     data = booking.to_dict()
     addons_text = _serialize_addons(data.get("addons"))
-    execute(
-        """
-        INSERT INTO bookings (
-            id, user_id, car_id, start_date, end_date, status, pickup_time, return_time,
-            base_daily_rate, addons, insurance_plan, insurance_daily_fee, late_fee_per_day,
-            total_estimated, total_final, created_at, updated_at
-        ) VALUES (
-            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-        )
-        """,
-        (
-            data["id"],
-            data["user_id"],
-            data["car_id"],
-            data["start_date"],
-            data["end_date"],
-            data["status"],
-            data.get("pickup_time"),
-            data.get("return_time"),
-            data["base_daily_rate"],
-            addons_text,
-            data["insurance_plan"],
-            data["insurance_daily_fee"],
-            data["late_fee_per_day"],
-            data["total_estimated"],
-            data.get("total_final"),
-            data["created_at"],
-            data["updated_at"],
-        ),
+    insert_params = (
+        data["id"],
+        data["user_id"],
+        data["car_id"],
+        data["start_date"],
+        data["end_date"],
+        data["status"],
+        data.get("pickup_time"),
+        data.get("return_time"),
+        data["base_daily_rate"],
+        addons_text,
+        data["insurance_plan"],
+        data["insurance_daily_fee"],
+        data["late_fee_per_day"],
+        data["total_estimated"],
+        data.get("total_final"),
+        data["created_at"],
+        data["updated_at"],
     )
+    try:
+        execute_all(
+            [
+                (_SQL_INSERT, insert_params),
+                (_SQL_APPEND_EVENT, (EVENT_CREATED, data["id"])),
+            ],
+            shard=shard,
+        )
+    except Exception:
+        # The directory row is written first; drop it so it never points at a missing booking.
+        if shard is not None:
+            sharding.unregister_booking(booking.id)
+        raise
     return booking
 
 
 def get_by_id(booking_id: UUID) -> Optional[Booking]:
-    init_db()
-    rows = query("SELECT * FROM bookings WHERE id = ?", (str(booking_id),))
+    shard = sharding.shard_for_booking(booking_id)
+    init_db(shard)
+    rows = query(_SQL_GET_BY_ID, (str(booking_id),), shard=shard)
     if not rows:
         return None
     return _row_to_booking(rows[0])
 
 
 def list_by_user(user_id: UUID) -> List[Booking]:
-    init_db()
-    rows = query("SELECT * FROM bookings WHERE user_id = ? ORDER BY created_at ASC", (str(user_id),))
+    # A customer may book at any branch, so this reads across shards.
+    rows = sharding.query_all_shards(
+        _SQL_LIST_BY_USER,
+        (str(user_id),),
+        sort_key="created_at",
+    )
     return [_row_to_booking(row) for row in rows]
 
 
-def list_pending() -> List[Booking]:
-    init_db()
-    rows = query("SELECT * FROM bookings WHERE status = 'pending' ORDER BY created_at ASC")
+def list_pending(use_replica: bool = False) -> List[Booking]:
+    rows = sharding.query_all_shards(
+        _SQL_LIST_PENDING,
+        sort_key="created_at",
+        use_replica=use_replica,
+    )
     return [_row_to_booking(row) for row in rows]
 
 
 def list_by_car(car_id: UUID) -> List[Booking]:
-    init_db()
-    rows = query("SELECT * FROM bookings WHERE car_id = ? ORDER BY created_at ASC", (str(car_id),))
+    shard = sharding.shard_for_car(car_id)
+    init_db(shard)
+    rows = query(_SQL_LIST_BY_CAR, (str(car_id),), shard=shard)
     return [_row_to_booking(row) for row in rows]
 
 
 def update_status(booking_id: UUID, status: str) -> None:
-    init_db()
-    execute(
-        "UPDATE bookings SET status = ?, updated_at = ? WHERE id = ?",
-        (status, _now_iso_utc(), str(booking_id)),
+    shard = sharding.shard_for_booking(booking_id)
+    init_db(shard)
+    execute_all(
+        [
+            (_SQL_UPDATE_STATUS, (status, _now_iso_utc(), str(booking_id))),
+            (_SQL_APPEND_EVENT, (EVENT_STATUS_CHANGED, str(booking_id))),
+        ],
+        shard=shard,
     )
 
 
 def set_pickup_time(booking_id: UUID, pickup_time_iso: str) -> None:
-    init_db()
+    shard = sharding.shard_for_booking(booking_id)
+    init_db(shard)
     execute(
-        "UPDATE bookings SET pickup_time = ?, updated_at = ? WHERE id = ?",
+        _SQL_SET_PICKUP_TIME,
         (pickup_time_iso, _now_iso_utc(), str(booking_id)),
+        shard=shard,
     )
 
 
 def set_return_time(booking_id: UUID, return_time_iso: str) -> None:
-    init_db()
+    shard = sharding.shard_for_booking(booking_id)
+    init_db(shard)
     execute(
-        "UPDATE bookings SET return_time = ?, updated_at = ? WHERE id = ?",
+        _SQL_SET_RETURN_TIME,
         (return_time_iso, _now_iso_utc(), str(booking_id)),
+        shard=shard,
     )
 
 
 def set_totals(booking_id: UUID, total_estimated: str, total_final: Optional[str]) -> None:
-    init_db()
+    shard = sharding.shard_for_booking(booking_id)
+    init_db(shard)
     execute(
-        """
-        UPDATE bookings
-        SET total_estimated = ?, total_final = ?, updated_at = ?
-        WHERE id = ?
-        """,
+        _SQL_SET_TOTALS,
         (total_estimated, total_final, _now_iso_utc(), str(booking_id)),
+        shard=shard,
     )
 
 
 def check_overlap(car_id: UUID, start_date_iso: str, end_date_iso: str) -> bool:
-    init_db()
-    # Overlap rule: NOT (new_end <= existing_start OR new_start >= existing_end)
+    shard = sharding.shard_for_car(car_id)
+    init_db(shard)
     rows = query(
-        """
-        SELECT 1 FROM bookings
-        WHERE car_id = ?
-          AND status IN ('approved', 'active', 'overdue')
-          AND NOT (? <= start_date OR ? >= end_date)
-        LIMIT 1
-        """,
+        _SQL_CHECK_OVERLAP,
         (str(car_id), end_date_iso, start_date_iso),
+        shard=shard,
     )
     return bool(rows)
 
@@ -7,25 +7,84 @@ from typing import List, Optional
 from uuid import UUID
 
 from src.models.car import Car
+from src.repositories import sharding, statements
 from src.repositories.sqlite_base import execute, init_db, query
 
 # Repository layer: SQL CRUD only, no business rules.
 
+_SQL_INSERT = statements.register(
+    "car.add",
+    """
+    INSERT INTO cars (
+        id, plate_no, make, model, year, category, daily_rate, deposit,
+        available_now, min_rent_days, max_rent_days, status, mileage, location,
+        created_at, updated_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    """,
+)
+_SQL_GET_BY_ID = statements.register("car.get_by_id", "SELECT * FROM cars WHERE id = ?")
+_SQL_GET_BY_PLATE = statements.register("car.get_by_plate", "SELECT * FROM cars WHERE plate_no = ?")
+_SQL_UPDATE = statements.register(
+    "car.update",
+    """
+    UPDATE cars
+    SET plate_no = ?,
+        make = ?,
+        model = ?,
+        year = ?,
+        category = ?,
+        daily_rate = ?,
+        deposit = ?,
+        available_now = ?,
+        min_rent_days = ?,
+        max_rent_days = ?,
+        status = ?,
+        mileage = ?,
+        location = ?,
+        created_at = ?,
+        updated_at = ?
+    WHERE id = ?
+    """,
+)
+_SQL_SET_STATUS = statements.register("car.set_status", "UPDATE cars SET status = ? WHERE id = ?")
+_SQL_SET_AVAILABLE_NOW = statements.register(
+    "car.set_available_now", "UPDATE cars SET available_now = ? WHERE id = ?"
+)
+_SQL_LIST_ALL = statements.register("car.list_all", "SELECT * FROM cars ORDER BY created_at ASC")
+_SQL_LIST_AVAILABLE = statements.register(
+    "car.list_available",
+    """
+    SELECT * FROM cars
+    WHERE status = 'active' AND available_now = 1
+    ORDER BY created_at ASC
+    """,
+)
+_SQL_LIST_AVAILABLE_AT = statements.register(
+    "car.list_available_at",
+    """
+    SELECT * FROM cars
+    WHERE status = 'active' AND available_now = 1 AND location = ?
+    ORDER BY created_at ASC
+    """,
+)
+
 
 def add(car: Car) -> Car:
-    init_db()
+    shard = sharding.shard_for_location(car.location)
+    init_db(shard)
     data = car.to_dict()
+    if shard is not None:
+        # Cars created before sharding was enabled stay in the main database.
+        init_db()
+        if query(_SQL_GET_BY_PLATE, (car.plate_no,)):
+            raise ValueError("plate_no must be unique")
+    # Claim the plate in the shard directory first so plates stay unique across shards.
+    sharding.register_car(car.id, car.plate_no, shard)
     try:
         execute(
-            """
-            INSERT INTO cars (
-                id, plate_no, make, model, year, category, daily_rate, deposit,
-                available_now, min_rent_days, max_rent_days, status, mileage, location,
-                created_at, updated_at
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-            """,
+            _SQL_INSERT,
             (
                 data["id"],
                 data["plate_no"],
@@ -44,54 +103,47 @@ def add(car: Car) -> Car:
                 data["created_at"],
                 data["updated_at"],
             ),
+            shard=shard,
         )
-    except sqlite3.IntegrityError as exc:
-        message = str(exc).lower()
-        if "plate_no" in message:
+    except Exception as exc:
+        # The directory rows were written first; drop them so they never point at a missing car.
+        sharding.unregister_car(car.id, car.plate_no)
+        if isinstance(exc, sqlite3.IntegrityError) and "plate_no" in str(exc).lower():
             raise ValueError("plate_no must be unique") from exc
         raise
     return car
 
 
 def get_by_id(car_id: UUID) -> Optional[Car]:
-    init_db()
-    rows = query("SELECT * FROM cars WHERE id = ?", (str(car_id),))
+    shard = sharding.shard_for_car(car_id)
+    init_db(shard)
+    rows = query(_SQL_GET_BY_ID, (str(car_id),), shard=shard)
     if not rows:
         return None
     return Car.from_dict(dict(rows[0]))
 
 
 def get_by_plate(plate_no: str) -> Optional[Car]:
-    init_db()
-    rows = query("SELECT * FROM cars WHERE plate_no = ?", (plate_no,))
+    shard = sharding.shard_for_plate(plate_no)
+    init_db(shard)
+    rows = query(_SQL_GET_BY_PLATE, (plate_no,), shard=shard)
     if not rows:
         return None
     return Car.from_dict(dict(rows[0]))
 
 
 def update(car: Car) -> None:
-    init_db()
+    shard = sharding.shard_for_car(car.id)
+    init_db(shard)
+    if sharding.is_enabled():
+        if shard is not None and sharding.shard_for_location(car.location) != shard:
+            raise ValueError("car location cannot change in sharded mode")
+        existing = get_by_id(car.id)
+        if existing is not None:
+            sharding.rename_plate(existing.plate_no, car.plate_no, shard)
     data = car.to_dict()
     execute(
-        """
-        UPDATE cars
-        SET plate_no = ?,
-            make = ?,
-            model = ?,
-            year = ?,
-            category = ?,
-            daily_rate = ?,
-            deposit = ?,
-            available_now = ?,
-            min_rent_days = ?,
-            max_rent_days = ?,
-            status = ?,
-            mileage = ?,
-            location = ?,
-            created_at = ?,
-            updated_at = ?
-        WHERE id = ?
-        """,
+        _SQL_UPDATE,
         (
             data["plate_no"],
             data["make"],
@@ -110,43 +162,49 @@ def update(car: Car) -> None:
             data["updated_at"],
             data["id"],
         ),
+        shard=shard,
     )
 
 
 def set_status(car_id: UUID, status: str) -> None:
-    init_db()
-    execute("UPDATE cars SET status = ? WHERE id = ?", (status, str(car_id)))
+    shard = sharding.shard_for_car(car_id)
+    init_db(shard)
+    execute(_SQL_SET_STATUS, (status, str(car_id)), shard=shard)
 
 
 def set_available_now(car_id: UUID, available_now: bool) -> None:
-    init_db()
+    shard = sharding.shard_for_car(car_id)
+    init_db(shard)
     value = 1 if available_now else 0
-    execute("UPDATE cars SET available_now = ? WHERE id = ?", (value, str(car_id)))
+    execute(_SQL_SET_AVAILABLE_NOW, (value, str(car_id)), shard=shard)
 
 
-def list_all() -> List[Car]:
-    init_db()
-    rows = query("SELECT * FROM cars ORDER BY created_at ASC")
+def list_all(use_replica: bool = False) -> List[Car]:
+    rows = sharding.query_all_shards(_SQL_LIST_ALL, sort_key="created_at", use_replica=use_replica)
     return [Car.from_dict(dict(row)) for row in rows]
 
 
-def list_available(location: Optional[str] = None) -> List[Car]:
-    init_db()
+def list_available(location: Optional[str] = None, use_replica: bool = False) -> List[Car]:
     if location is None:
-        rows = query(
-            """
-            SELECT * FROM cars
-            WHERE status = 'active' AND available_now = 1
-            ORDER BY created_at ASC
-            """
+        rows = sharding.query_all_shards(
+            _SQL_LIST_AVAILABLE,
+            sort_key="created_at",
+            use_replica=use_replica,
         )
     else:
-        rows = query(
-            """
-            SELECT * FROM cars
-            WHERE status = 'active' AND available_now = 1 AND location = ?
-            ORDER BY created_at ASC
-            """,
-            (location,),
-        )
+        # A single location only needs its own shard (plus the main database,
+        # which still holds cars created before sharding was enabled).
+        shard = sharding.shard_for_location(location)
+        rows = []
+        for database in dict.fromkeys([None, shard]):
+            init_db(database)
+            rows.extend(
+                query(
+                    _SQL_LIST_AVAILABLE_AT,
+                    (location,),
+                    shard=database,
+                    use_replica=use_replica,
+                )
+            )
+        rows.sort(key=lambda row: row["created_at"])
     return [Car.from_dict(dict(row)) for row in rows]
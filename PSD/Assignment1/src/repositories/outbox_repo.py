@@ -0,0 +1,135 @@
+"""Booking event outbox reader and consumer cursors (SQLite)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models.booking_event import BookingEvent
+from src.repositories import sharding, statements
+from src.repositories.sqlite_base import execute, init_db, query
+
+# booking_repo writes booking_events rows; this module tails them.
+#
+# A cursor is an opaque string holding the last event id read from each
+# database ("main=12,auckland=40"). Events are returned oldest first and
+# each database's events always come in id order, so a cursor never skips
+# an event even when several shards are read together. Delivery is
+# at-least-once: consumers save their cursor only after handling a batch.
+
+_MAIN_KEY = "main"
+_DEFAULT_BATCH_SIZE = 100
+
+_SQL_READ_AFTER = statements.register(
+    "outbox.read_after", "SELECT * FROM booking_events WHERE id > ? ORDER BY id ASC LIMIT ?"
+)
+_SQL_GET_CURSOR = statements.register(
+    "outbox.get_cursor", "SELECT cursor FROM event_consumers WHERE name = ?"
+)
+_SQL_SAVE_CURSOR = statements.register(
+    "outbox.save_cursor",
+    "INSERT OR REPLACE INTO event_consumers (name, cursor, updated_at) VALUES (?, ?, ?)",
+)
+_SQL_LIST_CURSORS = statements.register("outbox.list_cursors", "SELECT cursor FROM event_consumers")
+_SQL_DELETE_UP_TO = statements.register(
+    "outbox.delete_up_to", "DELETE FROM booking_events WHERE id <= ?"
+)
+
+
+def read(cursor: Optional[str] = None, limit: int = _DEFAULT_BATCH_SIZE) -> Tuple[List[BookingEvent], str]:
+    """Return up to limit events after cursor and the cursor to resume from."""
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    positions = _parse_cursor(cursor)
+    streams = []
+    for shard in sharding.all_shards():
+        init_db(shard)
+        rows = query(_SQL_READ_AFTER, (positions.get(_key(shard), 0), limit), shard=shard)
+        streams.append([_row_to_event(row, shard) for row in rows])
+
+    # Merge by time; heapq.merge keeps each shard's id order intact.
+    events = list(
+        heapq.merge(*streams, key=lambda event: (event.created_at, _key(event.shard), event.id))
+    )[:limit]
+    for event in events:
+        positions[_key(event.shard)] = event.id
+    return events, _format_cursor(positions)
+
+
+def get_cursor(consumer: str) -> Optional[str]:
+    init_db()
+    rows = query(_SQL_GET_CURSOR, (consumer,))
+    if not rows:
+        return None
+    return rows[0]["cursor"]
+
+
+def save_cursor(consumer: str, cursor: str) -> None:
+    _parse_cursor(cursor)
+    init_db()
+    execute(_SQL_SAVE_CURSOR, (consumer, cursor, _now_iso_utc()))
+
+
+def consume(
+    consumer: str,
+    handler: Callable[[BookingEvent], None],
+    limit: int = _DEFAULT_BATCH_SIZE,
+) -> int:
+    """Hand the next batch of events to handler, then commit the cursor.
+
+    If handler raises, the cursor is not saved and the batch is redelivered
+    on the next call, so handlers should be idempotent.
+    """
+    events, next_cursor = read(get_cursor(consumer), limit)
+    for event in events:
+        handler(event)
+    if events:
+        save_cursor(consumer, next_cursor)
+    return len(events)
+
+
+def prune_consumed() -> None:
+    """Delete events every registered consumer has already committed past."""
+    init_db()
+    cursors = [_parse_cursor(row["cursor"]) for row in query(_SQL_LIST_CURSORS)]
+    if not cursors:
+        return
+    for shard in sharding.all_shards():
+        safe_id = min(positions.get(_key(shard), 0) for positions in cursors)
+        if safe_id <= 0:
+            continue
+        init_db(shard)
+        # AUTOINCREMENT ids are never reused, so saved cursors stay valid after this.
+        execute(_SQL_DELETE_UP_TO, (safe_id,), shard=shard)
+
+
+def _key(shard: Optional[str]) -> str:
+    return _MAIN_KEY if shard is None else shard
+
+
+def _parse_cursor(cursor: Optional[str]) -> Dict[str, int]:
+    if not cursor:
+        return {}
+    positions: Dict[str, int] = {}
+    try:
+        for part in cursor.split(","):
+            key, _, value = part.partition("=")
+            positions[key] = int(value)
+    except ValueError as exc:
+        raise ValueError("invalid event cursor") from exc
+    return positions
+
+
+def _format_cursor(positions: Dict[str, int]) -> str:
+    return ",".join(f"{key}={value}" for key, value in sorted(positions.items()))
+
+
+def _row_to_event(row: object, shard: Optional[str]) -> BookingEvent:
+    data = dict(row)
+    data["shard"] = shard
+    return BookingEvent.from_dict(data)
+
+
+def _now_iso_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -0,0 +1,207 @@
+"""Location-based shard routing for cars and bookings (SQLite)."""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.config import SHARDED_STORAGE
+from src.repositories import statements
+from src.repositories.sqlite_base import execute, init_db, list_shard_names, query
+
+# Optional storage mode: one SQLite file per Car.location. Users, audit logs and
+# the shard directory stay in the main database; cars and bookings live in the
+# shard of the car's location. A shard of None always means the main database.
+#
+# Unknown ids route to the main database. Cars and bookings created before
+# sharding was switched on stay there (nothing moves them), so the main
+# database is always read alongside the shards.
+
+_ENV_SHARDED = os.getenv("CAR_RENTAL_SHARDED")
+_ENABLED = _ENV_SHARDED.strip().lower() in {"1", "true", "yes"} if _ENV_SHARDED else SHARDED_STORAGE
+
+_KIND_CAR = "car"
+_KIND_BOOKING = "booking"
+_KIND_PLATE = "plate"
+
+_SQL_CLAIM = statements.register(
+    "shard.claim", "INSERT INTO shard_directory (kind, key, shard) VALUES (?, ?, ?)"
+)
+_SQL_RELEASE_CAR = statements.register(
+    "shard.release_car",
+    "DELETE FROM shard_directory WHERE (kind = ? AND key = ?) OR (kind = ? AND key = ?)",
+)
+_SQL_RELEASE = statements.register(
+    "shard.release", "DELETE FROM shard_directory WHERE kind = ? AND key = ?"
+)
+_SQL_RENAME = statements.register(
+    "shard.rename", "UPDATE shard_directory SET key = ? WHERE kind = ? AND key = ?"
+)
+_SQL_LOOKUP = statements.register(
+    "shard.lookup", "SELECT shard FROM shard_directory WHERE kind = ? AND key = ?"
+)
+
+_CACHE_LOCK = threading.Lock()
+_DIRECTORY_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def set_enabled(enabled: bool) -> None:
+    """Switch sharded mode on/off (used by tools; default comes from env/config)."""
+    global _ENABLED
+    _ENABLED = bool(enabled)
+    with _CACHE_LOCK:
+        _DIRECTORY_CACHE.clear()
+
+
+def shard_for_location(location: str) -> Optional[str]:
+    if not _ENABLED:
+        return None
+    slug = re.sub(r"[^a-z0-9]+", "_", location.strip().lower()).strip("_")
+    return slug or "default"
+
+
+def shard_for_car(car_id: UUID) -> Optional[str]:
+    return _lookup(_KIND_CAR, str(car_id))
+
+
+def shard_for_booking(booking_id: UUID) -> Optional[str]:
+    return _lookup(_KIND_BOOKING, str(booking_id))
+
+
+def shard_for_plate(plate_no: str) -> Optional[str]:
+    return _lookup(_KIND_PLATE, plate_no)
+
+
+def all_shards() -> List[Optional[str]]:
+    """Databases that hold cars/bookings: the main DB, plus every shard when enabled."""
+    if not _ENABLED:
+        return [None]
+    return [None, *list_shard_names()]
+
+
+def register_car(car_id: UUID, plate_no: str, shard: Optional[str]) -> None:
+    if shard is None:
+        return
+    init_db()
+    try:
+        execute(
+            _SQL_CLAIM,
+            (_KIND_PLATE, plate_no, shard),
+        )
+    except sqlite3.IntegrityError as exc:
+        raise ValueError("plate_no must be unique") from exc
+    try:
+        execute(
+            _SQL_CLAIM,
+            (_KIND_CAR, str(car_id), shard),
+        )
+    except Exception as exc:
+        # Only the plate row is ours; an existing car row must stay.
+        execute(_SQL_RELEASE, (_KIND_PLATE, plate_no))
+        if isinstance(exc, sqlite3.IntegrityError):
+            raise ValueError("car already exists") from exc
+        raise
+    _remember(_KIND_PLATE, plate_no, shard)
+    _remember(_KIND_CAR, str(car_id), shard)
+
+
+def unregister_car(car_id: UUID, plate_no: str) -> None:
+    if not _ENABLED:
+        return
+    init_db()
+    execute(
+        _SQL_RELEASE_CAR,
+        (_KIND_CAR, str(car_id), _KIND_PLATE, plate_no),
+    )
+    _forget(_KIND_CAR, str(car_id))
+    _forget(_KIND_PLATE, plate_no)
+
+
+def rename_plate(old_plate_no: str, new_plate_no: str, shard: Optional[str]) -> None:
+    if shard is None or old_plate_no == new_plate_no:
+        return
+    init_db()
+    try:
+        execute(
+            _SQL_RENAME,
+            (new_plate_no, _KIND_PLATE, old_plate_no),
+        )
+    except sqlite3.IntegrityError as exc:
+        raise ValueError("plate_no must be unique") from exc
+    _forget(_KIND_PLATE, old_plate_no)
+    _remember(_KIND_PLATE, new_plate_no, shard)
+
+
+def register_booking(booking_id: UUID, shard: Optional[str]) -> None:
+    if shard is None:
+        return
+    init_db()
+    try:
+        execute(
+            _SQL_CLAIM,
+            (_KIND_BOOKING, str(booking_id), shard),
+        )
+    except sqlite3.IntegrityError as exc:
+        raise ValueError("booking already exists") from exc
+    _remember(_KIND_BOOKING, str(booking_id), shard)
+
+
+def unregister_booking(booking_id: UUID) -> None:
+    if not _ENABLED:
+        return
+    init_db()
+    execute(
+        _SQL_RELEASE,
+        (_KIND_BOOKING, str(booking_id)),
+    )
+    _forget(_KIND_BOOKING, str(booking_id))
+
+
+def query_all_shards(
+    sql: str,
+    params: Sequence[object] | None = None,
+    sort_key: Optional[str] = None,
+    use_replica: bool = False,
+) -> List[sqlite3.Row]:
+    """Cross-shard read path: run the query on every shard and merge the rows."""
+    shards = all_shards()
+    rows: List[sqlite3.Row] = []
+    for shard in shards:
+        init_db(shard)
+        rows.extend(query(sql, params, shard=shard, use_replica=use_replica))
+    if sort_key is not None and len(shards) > 1:
+        rows.sort(key=lambda row: row[sort_key])
+    return rows
+
+
+def _lookup(kind: str, key: str) -> Optional[str]:
+    if not _ENABLED:
+        return None
+    cached = _DIRECTORY_CACHE.get((kind, key))
+    if cached is not None:
+        return cached
+    init_db()
+    rows = query(_SQL_LOOKUP, (kind, key))
+    if not rows:
+        return None
+    shard = rows[0]["shard"]
+    _remember(kind, key, shard)
+    return shard
+
+
+def _remember(kind: str, key: str, shard: str) -> None:
+    with _CACHE_LOCK:
+        _DIRECTORY_CACHE[(kind, key)] = shard
+
+
+def _forget(kind: str, key: str) -> None:
+    with _CACHE_LOCK:
+        _DIRECTORY_CACHE.pop((kind, key), None)
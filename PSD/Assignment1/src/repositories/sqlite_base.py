@@ -7,7 +7,11 @@ import os
 import sqlite3
 import sys
 import threading
-from typing import Iterable, List, Optional, Sequence, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.models.user import normalize_email
+from src.repositories import statements
 
 def _default_base_dir() -> Path:
     # If running from a .pyz, store data next to the executable.
@@ -22,26 +26,177 @@ def _default_base_dir() -> Path:
 
 _ENV_DB_PATH = os.getenv("CAR_RENTAL_DB_PATH")
 _DB_PATH = Path(_ENV_DB_PATH).expanduser() if _ENV_DB_PATH else _default_base_dir() / "data" / "app.db"
+_SHARD_DIR_NAME = "shards"
+_REPLICA_DIR_NAME = "replicas"
+_STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection (sqlite3 default is 128).
+_SNAPSHOT_PAGES_PER_STEP = 256  # Small backup steps so live writers are not blocked for long.
 _DB_LOCK = threading.Lock()
-_CONNECTION: Optional[sqlite3.Connection] = None
+# One connection per database file; shard=None is the main app.db.
+_CONNECTIONS: Dict[Optional[str], sqlite3.Connection] = {}
+_INITIALIZED: Set[Optional[str]] = set()
+# Read-only connections to the latest snapshot of each database.
+_REPLICA_CONNECTIONS: Dict[Optional[str], sqlite3.Connection] = {}
+# Databases snapshotted by this process; replica files left by an earlier run are never read.
+_SNAPSHOTTED: Set[Optional[str]] = set()
+_SNAPSHOT_LOCK = threading.Lock()
+_SNAPSHOT_STOP = threading.Event()
+_SNAPSHOT_THREAD: Optional[threading.Thread] = None
+
+
+def db_path(shard: Optional[str] = None) -> Path:
+    """Return the file path for the main database or a location shard."""
+    if shard is None:
+        return _DB_PATH
+    return _DB_PATH.parent / _SHARD_DIR_NAME / f"{shard}.db"
+
+
+def replica_path(shard: Optional[str] = None) -> Path:
+    """Return the snapshot file path used for read-only reporting queries."""
+    replica_dir = _DB_PATH.parent / _REPLICA_DIR_NAME
+    if shard is None:
+        return replica_dir / _DB_PATH.name
+    return replica_dir / _SHARD_DIR_NAME / f"{shard}.db"
+
+
+def list_shard_names() -> List[str]:
+    """List shard databases that exist on disk (sorted by name)."""
+    shard_dir = _DB_PATH.parent / _SHARD_DIR_NAME
+    if not shard_dir.is_dir():
+        return []
+    return sorted(path.stem for path in shard_dir.glob("*.db"))
+
+
+def get_connection(shard: Optional[str] = None) -> sqlite3.Connection:
+    """Get a per-database singleton SQLite connection with basic thread safety."""
+    conn = _CONNECTIONS.get(shard)
+    if conn is None:
+        with _DB_LOCK:
+            conn = _CONNECTIONS.get(shard)
+            if conn is None:
+                path = db_path(shard)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    path.as_posix(),
+                    check_same_thread=False,
+                    cached_statements=_STATEMENT_CACHE_SIZE,
+                )
+                conn.row_factory = sqlite3.Row
+                _CONNECTIONS[shard] = conn
+    return conn
 
 
-def get_connection() -> sqlite3.Connection:
-    """Get a singleton SQLite connection with basic thread safety."""
-    global _CONNECTION
-    if _CONNECTION is None:
+def get_replica_connection(shard: Optional[str] = None) -> Optional[sqlite3.Connection]:
+    """Get a read-only connection to this process's latest snapshot, or None if there is none yet."""
+    conn = _REPLICA_CONNECTIONS.get(shard)
+    if conn is None:
         with _DB_LOCK:
-            if _CONNECTION is None:
-                _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-                _CONNECTION = sqlite3.connect(_DB_PATH.as_posix(), check_same_thread=False)
-                _CONNECTION.row_factory = sqlite3.Row
-    return _CONNECTION
+            conn = _REPLICA_CONNECTIONS.get(shard)
+            if conn is None:
+                path = replica_path(shard)
+                if shard not in _SNAPSHOTTED or not path.exists():
+                    return None
+                conn = _open_read_only(path)
+                _REPLICA_CONNECTIONS[shard] = conn
+    return conn
+
+
+def close_all() -> None:
+    """Close every open connection (main database, shards and replicas)."""
+    with _DB_LOCK:
+        for conn in list(_CONNECTIONS.values()) + list(_REPLICA_CONNECTIONS.values()):
+            conn.close()
+        _CONNECTIONS.clear()
+        _REPLICA_CONNECTIONS.clear()
+        _INITIALIZED.clear()
+
+
+def use_database(path: Path | str) -> None:
+    """Point the process at another main database file (tools and benchmarks)."""
+    global _DB_PATH
+    close_all()
+    _SNAPSHOTTED.clear()
+    _DB_PATH = Path(path).expanduser()
+
+
+def snapshot(shard: Optional[str] = None) -> Path:
+    """Copy a live database to its replica file with the online backup API."""
+    init_db(shard)
+    source = get_connection(shard)
+    path = replica_path(shard)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with _SNAPSHOT_LOCK:
+        target = sqlite3.connect(tmp_path.as_posix())
+        try:
+            source.backup(target, pages=_SNAPSHOT_PAGES_PER_STEP)
+        finally:
+            target.close()
+        with _DB_LOCK:
+            # Close the old snapshot first: it would leak a file handle, and
+            # Windows cannot replace a file that is still open.
+            old = _REPLICA_CONNECTIONS.pop(shard, None)
+            if old is not None:
+                old.close()
+            os.replace(tmp_path, path)
+            _REPLICA_CONNECTIONS[shard] = _open_read_only(path)
+            _SNAPSHOTTED.add(shard)
+    return path
+
+
+def snapshot_all() -> List[Path]:
+    """Snapshot the main database and every shard on disk."""
+    shards: List[Optional[str]] = [None]
+    shards.extend(list_shard_names())
+    return [snapshot(shard) for shard in shards]
 
 
-def init_db() -> None:
+def start_snapshots(interval_seconds: float) -> None:
+    """Refresh all replicas in a background thread every interval_seconds."""
+    global _SNAPSHOT_THREAD
+    if interval_seconds <= 0:
+        raise ValueError("interval_seconds must be > 0")
+    if _SNAPSHOT_THREAD is not None and _SNAPSHOT_THREAD.is_alive():
+        return
+    _SNAPSHOT_STOP.clear()
+
+    def _run() -> None:
+        while True:
+            try:
+                snapshot_all()
+            except (sqlite3.Error, OSError) as exc:
+                print(f"Snapshot failed: {exc}", file=sys.stderr)
+            if _SNAPSHOT_STOP.wait(interval_seconds):
+                return
+
+    _SNAPSHOT_THREAD = threading.Thread(target=_run, name="db-snapshot", daemon=True)
+    _SNAPSHOT_THREAD.start()
+
+
+def stop_snapshots() -> None:
+    global _SNAPSHOT_THREAD
+    _SNAPSHOT_STOP.set()
+    if _SNAPSHOT_THREAD is not None:
+        _SNAPSHOT_THREAD.join()
+        _SNAPSHOT_THREAD = None
+
+
+def _open_read_only(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"{path.resolve().as_uri()}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def init_db(shard: Optional[str] = None) -> None:
     """Initialize database schema and indexes."""
-    # Create tables and indexes if they do not exist.
-    conn = get_connection()
+    # Schema setup runs once per database file per process.
+    if shard in _INITIALIZED:
+        return
+    conn = get_connection(shard)
     with conn:
         conn.execute(
             """
@@ -50,6 +205,7 @@ def init_db() -> None:
                 role TEXT NOT NULL,
                 name TEXT NOT NULL,
                 email TEXT NOT NULL,
+                email_normalized TEXT,
                 phone TEXT,
                 driver_license_no TEXT,
                 status TEXT NOT NULL,
@@ -117,6 +273,7 @@ def init_db() -> None:
             """
         )
         conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email)")
+        _migrate_email_normalized(conn)
         conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_cars_plate_no ON cars(plate_no)")
         conn.execute(
             """
@@ -124,25 +281,143 @@ def init_db() -> None:
             ON bookings(car_id, start_date, end_date, status)
             """
         )
+        # Serves list_recent (newest first) and the retention cutoff scan.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_logs_created_at ON audit_logs(created_at, id)"
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_target
+            ON audit_logs(target_type, target_id, created_at)
+            """
+        )
+        # Filter + time-order indexes for audit_repo.find; the rowid (audit id) is the
+        # implicit last column of every index, which serves the keyset tiebreak.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_logs_actor ON audit_logs(actor_id, created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs(action, created_at)"
+        )
+        # Transactional outbox: one row per booking state change, written in the
+        # same transaction as the bookings row (so it lives in the booking's shard).
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS booking_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                booking_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                car_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                status TEXT NOT NULL,
+                total_estimated TEXT NOT NULL,
+                total_final TEXT,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        # Last committed outbox cursor per named consumer (main database only).
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_consumers (
+                name TEXT PRIMARY KEY,
+                cursor TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        # Routing table for sharded mode: which shard holds a car/booking/plate.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shard_directory (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                shard TEXT NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+    _INITIALIZED.add(shard)
+
+
+def _migrate_email_normalized(conn: sqlite3.Connection) -> None:
+    # Additive migration: older databases lack users.email_normalized.
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(users)")}
+    if "email_normalized" not in columns:
+        conn.execute("ALTER TABLE users ADD COLUMN email_normalized TEXT")
+    rows = conn.execute("SELECT id, email FROM users WHERE email_normalized IS NULL").fetchall()
+    conn.executemany(
+        "UPDATE users SET email_normalized = ? WHERE id = ?",
+        [(normalize_email(row["email"]), row["id"]) for row in rows],
+    )
+    try:
+        conn.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_normalized
+            ON users(email_normalized)
+            """
+        )
+    except sqlite3.IntegrityError:
+        # Existing accounts differ only by case; keep lookups indexed until they are merged.
+        print("Warning: duplicate emails (case-insensitive) found in users table", file=sys.stderr)
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_users_email_normalized_nonunique
+            ON users(email_normalized)
+            """
+        )
 
 
-def execute(sql: str, params: Sequence[object] | None = None) -> int:
+def execute(sql: str, params: Sequence[object] | None = None, shard: Optional[str] = None) -> int:
     """Execute a statement and return the last row id."""
-    conn = get_connection()
+    conn = get_connection(shard)
+    started = time.perf_counter()
     with conn:
         cursor = conn.execute(sql, params or ())
-        return cursor.lastrowid
+    statements.record(sql, (time.perf_counter() - started) * 1000, max(cursor.rowcount, 0))
+    return cursor.lastrowid
+
+
+def execute_all(
+    operations: Sequence[Tuple[str, Sequence[object]]], shard: Optional[str] = None
+) -> None:
+    """Execute several statements in a single transaction (all or nothing)."""
+    conn = get_connection(shard)
+    with conn:
+        for sql, params in operations:
+            started = time.perf_counter()
+            cursor = conn.execute(sql, params)
+            statements.record(sql, (time.perf_counter() - started) * 1000, max(cursor.rowcount, 0))
 
 
-def query(sql: str, params: Sequence[object] | None = None) -> List[sqlite3.Row]:
-    """Run a query and return all rows."""
-    conn = get_connection()
-    cursor = conn.execute(sql, params or ())
-    return list(cursor.fetchall())
+def query(
+    sql: str,
+    params: Sequence[object] | None = None,
+    shard: Optional[str] = None,
+    use_replica: bool = False,
+) -> List[sqlite3.Row]:
+    """Run a query and return all rows (optionally from the read-only snapshot)."""
+    conn = get_replica_connection(shard) if use_replica else None
+    if conn is None:
+        conn = get_connection(shard)
+    started = time.perf_counter()
+    try:
+        rows = conn.execute(sql, params or ()).fetchall()
+    except sqlite3.ProgrammingError:
+        if not use_replica:
+            raise
+        # The snapshot was refreshed (and its connection closed) under us; read the primary.
+        rows = get_connection(shard).execute(sql, params or ()).fetchall()
+    statements.record(sql, (time.perf_counter() - started) * 1000, len(rows))
+    return rows
 
 
-def executemany(sql: str, seq_of_params: Iterable[Sequence[object]]) -> None:
+def executemany(
+    sql: str, seq_of_params: Iterable[Sequence[object]], shard: Optional[str] = None
+) -> None:
     """Execute a statement against a sequence of parameters."""
-    conn = get_connection()
+    conn = get_connection(shard)
+    started = time.perf_counter()
     with conn:
-        conn.executemany(sql, seq_of_params)
+        cursor = conn.executemany(sql, seq_of_params)
+    statements.record(sql, (time.perf_counter() - started) * 1000, max(cursor.rowcount, 0))
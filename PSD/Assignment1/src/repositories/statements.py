@@ -0,0 +1,138 @@
+"""Named SQL statement registry with per-statement timing stats."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.config import SLOW_QUERY_MS
+
+# Repositories register their SQL once at import time under a stable name.
+# sqlite_base looks the name up by SQL text and records timing for each call.
+# Python's sqlite3 caches prepared statements by SQL text, so module-level
+# constants also keep each statement prepared for the life of the connection.
+
+_ADHOC_NAME = "adhoc"
+# Latency histogram bucket upper bounds in milliseconds (last bucket is open-ended).
+_BUCKET_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+_ENV_SLOW_QUERY_MS = os.getenv("CAR_RENTAL_SLOW_QUERY_MS")
+_SLOW_QUERY_MS = float(_ENV_SLOW_QUERY_MS) if _ENV_SLOW_QUERY_MS else float(SLOW_QUERY_MS)
+_SLOW_LOG = logging.getLogger("car_rental.slow_query")
+
+_LOCK = threading.Lock()
+_SQL_BY_NAME: Dict[str, str] = {}
+_NAME_BY_SQL: Dict[str, str] = {}
+
+
+@dataclass
+class StatementStats:
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(_BUCKET_BOUNDS_MS) + 1))
+
+    def add(self, elapsed_ms: float, rows: int) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.buckets[_bucket_index(elapsed_ms)] += 1
+
+    def percentile(self, pct: float) -> float:
+        # Upper bound of the bucket holding the pct-th call (capped by the max seen).
+        if self.calls == 0:
+            return 0.0
+        rank = max(1, int(round(self.calls * pct / 100.0)))
+        seen = 0
+        for idx, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if idx < len(_BUCKET_BOUNDS_MS):
+                    return min(_BUCKET_BOUNDS_MS[idx], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+_STATS: Dict[str, StatementStats] = {}
+
+
+def register(name: str, sql: str) -> str:
+    """Register sql under name and return it unchanged (for module constants)."""
+    with _LOCK:
+        existing = _SQL_BY_NAME.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"statement already registered with different SQL: {name}")
+        _SQL_BY_NAME[name] = sql
+        _NAME_BY_SQL[sql] = name
+    return sql
+
+
+def name_for(sql: str) -> str:
+    return _NAME_BY_SQL.get(sql, _ADHOC_NAME)
+
+
+def registered() -> Dict[str, str]:
+    """Return a copy of name -> SQL for every registered statement."""
+    with _LOCK:
+        return dict(_SQL_BY_NAME)
+
+
+def record(sql: str, elapsed_ms: float, rows: int) -> None:
+    name = name_for(sql)
+    with _LOCK:
+        stats = _STATS.get(name)
+        if stats is None:
+            stats = _STATS[name] = StatementStats()
+        stats.add(elapsed_ms, rows)
+    if elapsed_ms >= _SLOW_QUERY_MS:
+        _SLOW_LOG.warning("slow query %s took %.1f ms (%d rows)", name, elapsed_ms, rows)
+
+
+def set_slow_query_threshold(threshold_ms: float) -> None:
+    global _SLOW_QUERY_MS
+    _SLOW_QUERY_MS = float(threshold_ms)
+
+
+def stats(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Stats per statement name, most expensive (total time) first."""
+    with _LOCK:
+        items = [(key, value.to_dict()) for key, value in _STATS.items() if name in (None, key)]
+    items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+    return dict(items)
+
+
+def reset_stats() -> None:
+    with _LOCK:
+        _STATS.clear()
+
+
+def format_report() -> str:
+    lines = [f"{'statement':<32} {'calls':>8} {'rows':>10} {'total_ms':>11} {'p99_ms':>9}"]
+    for key, value in stats().items():
+        lines.append(
+            f"{key:<32} {value['calls']:>8} {value['rows']:>10} "
+            f"{value['total_ms']:>11.2f} {value['p99_ms']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _bucket_index(elapsed_ms: float) -> int:
+    for idx, bound in enumerate(_BUCKET_BOUNDS_MS):
+        if elapsed_ms <= bound:
+            return idx
+    return len(_BUCKET_BOUNDS_MS)
@@ -2,59 +2,115 @@
 
 from __future__ import annotations
 
+import dataclasses
+import sqlite3
 from typing import List, Optional
 from uuid import UUID
 
-from src.models.user import User
-from src.repositories.sqlite_base import execute, init_db, query
+from src.config import USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS
+from src.models.user import User, normalize_email
+from src.repositories import statements
+from src.repositories.cache import TTLCache
+from src.repositories.sqlite_base import db_path, execute, init_db, query
 
 # Repository layer: SQL CRUD only, no business rules.
+# Lookups by id/email are cached briefly so repeated logins skip the database;
+# every write through this module drops the affected user from the cache.
+
+_CACHE: TTLCache[User] = TTLCache(USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_ENTRIES)
+
+_SQL_INSERT = statements.register(
+    "user.create",
+    """
+    INSERT INTO users (
+        id, role, name, email, email_normalized, phone, driver_license_no, status,
+        created_at, updated_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    """,
+)
+_SQL_GET_BY_ID = statements.register("user.get_by_id", "SELECT * FROM users WHERE id = ?")
+_SQL_GET_BY_EMAIL = statements.register("user.get_by_email", "SELECT * FROM users WHERE email_normalized = ?")
+_SQL_LIST = statements.register("user.list", "SELECT * FROM users ORDER BY created_at ASC")
+_SQL_UPDATE = statements.register(
+    "user.update",
+    """
+    UPDATE users
+    SET role = ?,
+        name = ?,
+        email = ?,
+        email_normalized = ?,
+        phone = ?,
+        driver_license_no = ?,
+        status = ?,
+        created_at = ?,
+        updated_at = ?
+    WHERE id = ?
+    """,
+)
+_SQL_DELETE = statements.register("user.delete", "DELETE FROM users WHERE id = ?")
 
 
 def create_user(user: User) -> None:
     init_db()
     data = user.to_dict()
-    execute(
-        """
-        INSERT INTO users (
-            id, role, name, email, phone, driver_license_no, status, created_at, updated_at
-        ) VALUES (
-            ?, ?, ?, ?, ?, ?, ?, ?, ?
+    try:
+        execute(
+            _SQL_INSERT,
+            (
+                data["id"],
+                data["role"],
+                data["name"],
+                data["email"],
+                normalize_email(data["email"]),
+                data["phone"],
+                data["driver_license_no"],
+                data["status"],
+                data["created_at"],
+                data["updated_at"],
+            ),
         )
-        """,
-        (
-            data["id"],
-            data["role"],
-            data["name"],
-            data["email"],
-            data["phone"],
-            data["driver_license_no"],
-            data["status"],
-            data["created_at"],
-            data["updated_at"],
-        ),
-    )
+    except sqlite3.IntegrityError as exc:
+        if "email" in str(exc).lower():
+            raise ValueError("email already registered") from exc
+        raise
+    _invalidate(user.id)
 
 
 def get_user_by_id(user_id: UUID) -> Optional[User]:
+    key = ("id", str(db_path()), str(user_id))
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return dataclasses.replace(cached)
     init_db()
-    rows = query("SELECT * FROM users WHERE id = ?", (str(user_id),))
+    rows = query(_SQL_GET_BY_ID, (str(user_id),))
     if not rows:
         return None
-    return _row_to_user(rows[0])
+    user = _row_to_user(rows[0])
+    _CACHE.put(key, dataclasses.replace(user))
+    return user
 
 
 def get_user_by_email(email: str) -> Optional[User]:
+    # Case-insensitive: "Alice@Example.com" finds the account registered as "alice@example.com".
+    normalized = normalize_email(email)
+    key = ("email", str(db_path()), normalized)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return dataclasses.replace(cached)
     init_db()
-    rows = query("SELECT * FROM users WHERE email = ?", (email,))
+    rows = query(_SQL_GET_BY_EMAIL, (normalized,))
     if not rows:
         return None
-    return _row_to_user(rows[0])
+    user = _row_to_user(rows[0])
+    _CACHE.put(key, dataclasses.replace(user))
+    return user
 
 
 def list_users() -> List[User]:
     init_db()
-    rows = query("SELECT * FROM users ORDER BY created_at ASC")
+    rows = query(_SQL_LIST)
     return [_row_to_user(row) for row in rows]
 
 
@@ -62,22 +118,12 @@ def update_user(user: User) -> None:
     init_db()
     data = user.to_dict()
     execute(
-        """
-        UPDATE users
-        SET role = ?,
-            name = ?,
-            email = ?,
-            phone = ?,
-            driver_license_no = ?,
-            status = ?,
-            created_at = ?,
-            updated_at = ?
-        WHERE id = ?
-        """,
+        _SQL_UPDATE,
         (
             data["role"],
             data["name"],
             data["email"],
+            normalize_email(data["email"]),
             data["phone"],
             data["driver_license_no"],
             data["status"],
@@ -86,11 +132,22 @@ def update_user(user: User) -> None:
             data["id"],
         ),
     )
+    _invalidate(user.id)
 
 
 def delete_user(user_id: UUID) -> None:
     init_db()
-    execute("DELETE FROM users WHERE id = ?", (str(user_id),))
+    execute(_SQL_DELETE, (str(user_id),))
+    _invalidate(user_id)
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
+
+
+def _invalidate(user_id: UUID) -> None:
+    # Drops both the by-id and the by-email entry, including a stale old email.
+    _CACHE.invalidate_where(lambda cached: str(cached.id) == str(user_id))
 
 
 def _row_to_user(row: object) -> User:
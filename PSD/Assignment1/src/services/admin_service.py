@@ -3,63 +3,101 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
+from src.models.audit import AuditEntry
 from src.models.booking import Booking
 from src.models.car import Car
 from src.models.user import User
-from src.repositories import booking_repo, car_repo
-from src.services import auth_service, booking_service
+from src.repositories import audit_repo, booking_repo, car_repo, user_repo
+from src.services import auth_service, booking_service, session_service
 
 # Admin-only wrappers that delegate to repos/services.
+# Each call takes either the logged-in User or a session token from
+# session_service; a token is authorized from its role claim without a DB read.
+Principal = Union[User, str]
 
 
-def add_car(admin_user: User, car: Car) -> Car:
-    auth_service.require_admin(admin_user)
+def add_car(admin_user: Principal, car: Car) -> Car:
+    _require_admin(admin_user)
     return car_repo.add(car)
 
 
-def update_car(admin_user: User, car: Car) -> None:
-    auth_service.require_admin(admin_user)
+def update_car(admin_user: Principal, car: Car) -> None:
+    _require_admin(admin_user)
     car_repo.update(car)
 
 
-def set_car_status(admin_user: User, car_id: UUID, status: str) -> None:
-    auth_service.require_admin(admin_user)
+def set_car_status(admin_user: Principal, car_id: UUID, status: str) -> None:
+    _require_admin(admin_user)
     car_repo.set_status(car_id, status)
 
 
-def list_cars(admin_user: User) -> List[Car]:
-    auth_service.require_admin(admin_user)
-    return car_repo.list_all()
+# use_replica=True reads the latest snapshot (may lag live data) for reporting.
+def list_cars(admin_user: Principal, use_replica: bool = False) -> List[Car]:
+    _require_admin(admin_user)
+    return car_repo.list_all(use_replica=use_replica)
 
 
-def list_available_cars(admin_user: User, location: Optional[str] = None) -> List[Car]:
-    auth_service.require_admin(admin_user)
-    return car_repo.list_available(location)
+def list_available_cars(
+    admin_user: Principal, location: Optional[str] = None, use_replica: bool = False
+) -> List[Car]:
+    _require_admin(admin_user)
+    return car_repo.list_available(location, use_replica=use_replica)
 
 
-def list_pending_bookings(admin_user: User) -> List[Booking]:
-    auth_service.require_admin(admin_user)
-    return booking_repo.list_pending()
+def list_pending_bookings(admin_user: Principal, use_replica: bool = False) -> List[Booking]:
+    _require_admin(admin_user)
+    return booking_repo.list_pending(use_replica=use_replica)
 
 
-def approve_booking(admin_user: User, booking_id: UUID) -> Booking:
-    auth_service.require_admin(admin_user)
-    return booking_service.approve_booking(admin_user.id, booking_id)
+def approve_booking(admin_user: Principal, booking_id: UUID) -> Booking:
+    actor_id = _require_admin(admin_user)
+    return booking_service.approve_booking(actor_id, booking_id)
 
 
-def reject_booking(admin_user: User, booking_id: UUID, reason: str) -> Booking:
-    auth_service.require_admin(admin_user)
-    return booking_service.reject_booking(admin_user.id, booking_id, reason)
+def reject_booking(admin_user: Principal, booking_id: UUID, reason: str) -> Booking:
+    actor_id = _require_admin(admin_user)
+    return booking_service.reject_booking(actor_id, booking_id, reason)
 
 
-def pickup_booking(admin_user: User, booking_id: UUID) -> Booking:
-    auth_service.require_admin(admin_user)
-    return booking_service.pickup(admin_user.id, booking_id)
+def pickup_booking(admin_user: Principal, booking_id: UUID) -> Booking:
+    actor_id = _require_admin(admin_user)
+    return booking_service.pickup(actor_id, booking_id)
+
+
+def return_booking(admin_user: Principal, booking_id: UUID, return_time_dt: datetime) -> Booking:
+    actor_id = _require_admin(admin_user)
+    return booking_service.return_car(actor_id, booking_id, return_time_dt)
+
+
+def update_user(admin_user: Principal, user: User) -> None:
+    _require_admin(admin_user)
+    user.validate()
+    current = user_repo.get_user_by_id(user.id)
+    if current is None:
+        raise ValueError("user not found")
+    user_repo.update_user(user)
+    # Sessions carry the role from login; end them when the role or status changes.
+    if (current.role, current.status) != (user.role, user.status):
+        session_service.revoke_user(user.id)
+
+
+def delete_user(admin_user: Principal, user_id: UUID) -> None:
+    _require_admin(admin_user)
+    user_repo.delete_user(user_id)
+    session_service.revoke_user(user_id)
+
+
+def booking_history(admin_user: Principal, booking_id: UUID) -> List[AuditEntry]:
+    _require_admin(admin_user)
+    return audit_repo.history("booking", booking_id)
 
 
-def return_booking(admin_user: User, booking_id: UUID, return_time_dt: datetime) -> Booking:
+def _require_admin(admin_user: Principal) -> UUID:
+    # Returns the acting admin's id for audit attribution.
+    if isinstance(admin_user, str):
+        return session_service.require_admin(admin_user).user_id
     auth_service.require_admin(admin_user)
-    return booking_service.return_car(admin_user.id, booking_id, return_time_dt)
+    return admin_user.id
@@ -58,11 +58,11 @@ class AuthService:
         return user
 
     def require_admin(self, user: User) -> None:
-        if _role_value(user) != UserRole.ADMIN.value:
+        if role_value(user) != UserRole.ADMIN.value:
             raise ValueError("admin required")
 
     def require_customer(self, user: User) -> None:
-        if _role_value(user) != UserRole.CUSTOMER.value:
+        if role_value(user) != UserRole.CUSTOMER.value:
             raise ValueError("customer required")
 
 
@@ -85,6 +85,7 @@ def require_customer(user: User) -> None:
     _DEFAULT_AUTH.require_customer(user)
 
 
-def _role_value(user: User) -> str:
+def role_value(user: User) -> str:
+    """The user's role as its string value (also accepts a plain-string role)."""
     value = user.role.value if hasattr(user.role, "value") else str(user.role)
     return value
@@ -0,0 +1,125 @@
+"""Session tokens for authenticated callers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import secrets
+import threading
+from typing import Dict, Optional
+from uuid import UUID
+
+from src.config import SESSION_TTL_SECONDS
+from src.models.session import Session
+from src.models.user import User, UserRole
+from src.services import auth_service
+
+# Tokens map to Session objects in an in-process store. Checking a token is a
+# dict lookup plus an expiry comparison; the user row is read only at login.
+# admin_service.update_user/delete_user call revoke_user when a user's role or
+# status changes or the user is deleted, so a demoted, suspended or removed
+# account cannot keep using its token.
+
+# Expired sessions are swept on issue once this many tokens were handed out.
+_SWEEP_EVERY = 256
+
+
+class SessionStore:
+    """Session issuance and lookup with a configurable lifetime."""
+
+    def __init__(self, ttl_seconds: int = SESSION_TTL_SECONDS) -> None:
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Session] = {}
+        self._issued_since_sweep = 0
+
+    def issue(self, user: User, now: Optional[datetime] = None) -> Session:
+        now = now or datetime.now(timezone.utc)
+        session = Session(
+            token=secrets.token_urlsafe(32),
+            user_id=user.id,
+            role=UserRole(auth_service.role_value(user)),
+            name=user.name,
+            issued_at=now,
+            expires_at=now + self._ttl,
+        )
+        with self._lock:
+            self._sessions[session.token] = session
+            self._issued_since_sweep += 1
+            if self._issued_since_sweep >= _SWEEP_EVERY:
+                self._sweep(now)
+                self._issued_since_sweep = 0
+        return session
+
+    def resolve(self, token: str, now: Optional[datetime] = None) -> Session:
+        session = self._sessions.get(token)
+        if session is None:
+            raise ValueError("invalid session")
+        if session.is_expired(now or datetime.now(timezone.utc)):
+            self.revoke(token)
+            raise ValueError("session expired")
+        return session
+
+    def require_admin(self, token: str) -> Session:
+        session = self.resolve(token)
+        if session.role != UserRole.ADMIN:
+            raise ValueError("admin required")
+        return session
+
+    def require_customer(self, token: str) -> Session:
+        session = self.resolve(token)
+        if session.role != UserRole.CUSTOMER:
+            raise ValueError("customer required")
+        return session
+
+    def revoke(self, token: str) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def revoke_user(self, user_id: UUID) -> int:
+        with self._lock:
+            tokens = [token for token, session in self._sessions.items() if session.user_id == user_id]
+            for token in tokens:
+                del self._sessions[token]
+        return len(tokens)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _sweep(self, now: datetime) -> None:
+        # Caller holds self._lock.
+        expired = [token for token, session in self._sessions.items() if session.is_expired(now)]
+        for token in expired:
+            del self._sessions[token]
+
+
+_DEFAULT_STORE = SessionStore()
+
+
+def login_by_email(email: str) -> Session:
+    return _DEFAULT_STORE.issue(auth_service.login_by_email(email))
+
+
+def issue(user: User) -> Session:
+    return _DEFAULT_STORE.issue(user)
+
+
+def resolve(token: str) -> Session:
+    return _DEFAULT_STORE.resolve(token)
+
+
+def require_admin(token: str) -> Session:
+    return _DEFAULT_STORE.require_admin(token)
+
+
+def require_customer(token: str) -> Session:
+    return _DEFAULT_STORE.require_customer(token)
+
+
+def logout(token: str) -> None:
+    _DEFAULT_STORE.revoke(token)
+
+
+def revoke_user(user_id: UUID) -> int:
+    """End every session of a user (after a role change, suspension or delete)."""
+    return _DEFAULT_STORE.revoke_user(user_id)
@@ -0,0 +1,3 @@
+"""Package initializer."""
+
+# Developer tools (diagnostics, benchmarks, data generation).
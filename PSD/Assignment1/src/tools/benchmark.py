@@ -0,0 +1,341 @@
+"""End-to-end benchmark for the rental workload (JSON report)."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import json
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from src.models.booking import Booking, BookingStatus, InsurancePlan
+from src.models.car import Car, CarCategory, CarStatus
+from src.models.user import User, UserRole, UserStatus
+from src.repositories import booking_repo, car_repo, sharding, sqlite_base, statements, user_repo
+from src.services import admin_service, booking_service, pricing_service
+
+# Seeds a synthetic fleet through the real repositories, then replays a weighted
+# mix of service calls against it and reports throughput and latency percentiles.
+
+_LOCATIONS = ["Auckland", "Wellington", "Christchurch", "Queenstown", "Hamilton"]
+_MAKES = [("Toyota", "Corolla"), ("Mazda", "CX-5"), ("Ford", "Ranger"), ("Tesla", "Model 3"), ("Kia", "Carnival")]
+_CATEGORIES = list(CarCategory)
+_HISTORY_STATUSES = [BookingStatus.COMPLETED] * 8 + [BookingStatus.CANCELLED, BookingStatus.REJECTED]
+
+# Operation mix (relative weights).
+_DEFAULT_MIX = {
+    "create_booking": 30,
+    "approve_booking": 12,
+    "pickup": 8,
+    "return_car": 8,
+    "suggest_substitutions": 10,
+    "list_available_cars": 12,
+    "list_pending_bookings": 8,
+    "list_my_bookings": 8,
+    "list_all_cars": 4,
+}
+
+
+@dataclass
+class BenchConfig:
+    cars: int = 200
+    customers: int = 500
+    history_years: int = 2
+    bookings_per_car_year: int = 20
+    operations: int = 5000
+    seed: int = 42
+    sharded: bool = False
+
+
+@dataclass
+class _State:
+    admin: User
+    customer_ids: List[UUID]
+    car_ids: List[UUID]
+    booking_ids: List[UUID]
+    pending: List[UUID] = field(default_factory=list)
+    approved: List[UUID] = field(default_factory=list)
+    active: List[UUID] = field(default_factory=list)
+
+
+def run(config: BenchConfig, db_path: Path) -> Dict[str, Any]:
+    sqlite_base.use_database(db_path)
+    sharding.set_enabled(config.sharded)
+    sqlite_base.init_db()
+    rng = random.Random(config.seed)
+
+    started = time.perf_counter()
+    state = _seed(config, rng)
+    seed_seconds = time.perf_counter() - started
+
+    statements.reset_stats()
+    # Rejected operations are timed separately: some (an empty pool in _pop) do
+    # no database work, and would pull the percentiles and throughput down.
+    latencies: Dict[str, List[float]] = {name: [] for name in _DEFAULT_MIX}
+    rejected: Dict[str, List[float]] = {name: [] for name in _DEFAULT_MIX}
+    handlers = _handlers(state, rng)
+    names = list(_DEFAULT_MIX)
+    weights = [_DEFAULT_MIX[name] for name in names]
+
+    started = time.perf_counter()
+    for name in rng.choices(names, weights=weights, k=config.operations):
+        op_started = time.perf_counter()
+        try:
+            handlers[name]()
+        except ValueError:
+            # Business-rule rejections (overlap, unavailable car) are part of the workload.
+            rejected[name].append((time.perf_counter() - op_started) * 1000)
+        else:
+            latencies[name].append((time.perf_counter() - op_started) * 1000)
+    run_seconds = time.perf_counter() - started
+    completed = sum(len(values) for values in latencies.values())
+
+    return {
+        "config": config.__dict__,
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "seed_seconds": round(seed_seconds, 3),
+        "run_seconds": round(run_seconds, 3),
+        "completed_operations": completed,
+        "throughput_ops_per_s": round(completed / run_seconds, 1) if run_seconds else 0.0,
+        "operations": {
+            name: _summarize(values, rejected[name])
+            for name, values in latencies.items()
+            if values or rejected[name]
+        },
+        "statements": statements.stats(),
+    }
+
+
+def _seed(config: BenchConfig, rng: random.Random) -> _State:
+    admin = User(
+        id=uuid4(), role=UserRole.ADMIN, name="Bench Admin", email="bench-admin@example.com"
+    )
+    admin.validate()
+    user_repo.create_user(admin)
+
+    customer_ids: List[UUID] = []
+    for idx in range(config.customers):
+        user = User(
+            id=_uuid(rng),
+            role=UserRole.CUSTOMER,
+            name=f"Customer {idx}",
+            email=f"customer{idx}@example.com",
+            phone=None,
+            driver_license_no=f"NZ{idx:06d}",
+            status=UserStatus.ACTIVE,
+        )
+        user.validate()
+        user_repo.create_user(user)
+        customer_ids.append(user.id)
+
+    car_ids: List[UUID] = []
+    for idx in range(config.cars):
+        make, model = rng.choice(_MAKES)
+        car = Car(
+            id=_uuid(rng),
+            plate_no=f"BEN{idx:05d}",
+            make=make,
+            model=model,
+            year=rng.randint(2012, 2024),
+            mileage=rng.randint(0, 200_000),
+            available_now=True,
+            min_rent_days=1,
+            max_rent_days=rng.choice([7, 14, 30]),
+            daily_rate=Decimal(rng.randint(40, 160)),
+            deposit=Decimal(rng.choice([0, 100, 250])),
+            category=rng.choice(_CATEGORIES),
+            status=CarStatus.ACTIVE,
+            location=rng.choice(_LOCATIONS),
+        )
+        car.validate()
+        car_repo.add(car)
+        car_ids.append(car.id)
+
+    # Historical bookings go straight to the repository: the service only accepts future dates.
+    booking_ids: List[UUID] = []
+    today = date.today()
+    history_days = 365 * config.history_years
+    per_car = config.bookings_per_car_year * config.history_years
+    for car_id in car_ids:
+        car = car_repo.get_by_id(car_id)
+        cursor = today - timedelta(days=history_days)
+        for _ in range(per_car):
+            start = cursor + timedelta(days=rng.randint(0, 10))
+            end = start + timedelta(days=rng.randint(1, 7))
+            if end >= today:
+                break
+            cursor = end
+            booking = _history_booking(rng, car, rng.choice(customer_ids), start, end)
+            booking_repo.create(booking)
+            booking_ids.append(booking.id)
+
+    return _State(admin=admin, customer_ids=customer_ids, car_ids=car_ids, booking_ids=booking_ids)
+
+
+def _history_booking(rng: random.Random, car: Car, user_id: UUID, start: date, end: date) -> Booking:
+    status = rng.choice(_HISTORY_STATUSES)
+    created = datetime.combine(start - timedelta(days=rng.randint(1, 30)), datetime.min.time(), timezone.utc)
+    booking = Booking(
+        id=_uuid(rng),
+        user_id=user_id,
+        car_id=car.id,
+        start_date=start,
+        end_date=end,
+        status=status,
+        base_daily_rate=car.daily_rate,
+        addons={"gps": "5.00"} if rng.random() < 0.3 else {},
+        insurance_plan=rng.choice(list(InsurancePlan)),
+        insurance_daily_fee=Decimal("15.00"),
+        late_fee_per_day=Decimal("20.00"),
+        total_estimated=Decimal("0.00"),
+        created_at=created,
+        updated_at=created,
+    )
+    booking.total_estimated = pricing_service.compute_estimated_total(booking)
+    if status == BookingStatus.COMPLETED:
+        booking.pickup_time = datetime.combine(start, datetime.min.time(), timezone.utc)
+        booking.return_time = datetime.combine(end, datetime.min.time(), timezone.utc)
+        booking.total_final = pricing_service.compute_final_total(booking)
+    booking.validate()
+    return booking
+
+
+def _handlers(state: _State, rng: random.Random) -> Dict[str, Callable[[], Any]]:
+    admin = state.admin
+
+    def create_booking() -> None:
+        start = date.today() + timedelta(days=rng.randint(1, 365))
+        booking = booking_service.create_booking(
+            rng.choice(state.customer_ids),
+            rng.choice(state.car_ids),
+            start,
+            start + timedelta(days=rng.randint(1, 7)),
+            rng.choice(["none", "basic", "premium"]),
+            {"gps": "5.00"} if rng.random() < 0.3 else None,
+        )
+        state.pending.append(booking.id)
+        state.booking_ids.append(booking.id)
+
+    def approve_booking() -> None:
+        booking_id = _pop(rng, state.pending)
+        admin_service.approve_booking(admin, booking_id)
+        state.approved.append(booking_id)
+
+    def pickup() -> None:
+        booking_id = _pop(rng, state.approved)
+        admin_service.pickup_booking(admin, booking_id)
+        state.active.append(booking_id)
+
+    def return_car() -> None:
+        booking_id = _pop(rng, state.active)
+        admin_service.return_booking(admin, booking_id, datetime.now(timezone.utc))
+
+    def suggest_substitutions() -> None:
+        booking_service.suggest_substitutions(rng.choice(state.booking_ids))
+
+    return {
+        "create_booking": create_booking,
+        "approve_booking": approve_booking,
+        "pickup": pickup,
+        "return_car": return_car,
+        "suggest_substitutions": suggest_substitutions,
+        "list_available_cars": lambda: car_repo.list_available(rng.choice(_LOCATIONS + [None])),
+        "list_pending_bookings": lambda: admin_service.list_pending_bookings(admin),
+        "list_my_bookings": lambda: booking_repo.list_by_user(rng.choice(state.customer_ids)),
+        "list_all_cars": lambda: admin_service.list_cars(admin),
+    }
+
+
+def _pop(rng: random.Random, pool: List[UUID]) -> UUID:
+    if not pool:
+        raise ValueError("nothing to process")
+    idx = rng.randrange(len(pool))
+    pool[idx], pool[-1] = pool[-1], pool[idx]
+    return pool.pop()
+
+
+def _uuid(rng: random.Random) -> UUID:
+    # Deterministic ids so two runs with the same seed touch the same rows.
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _summarize(values: List[float], rejected: List[float]) -> Dict[str, Any]:
+    # Latency figures cover successful operations only.
+    summary: Dict[str, Any] = {
+        "count": len(values),
+        "errors": len(rejected),
+        "rejected_mean_ms": round(sum(rejected) / len(rejected), 3) if rejected else None,
+    }
+    if not values:
+        return summary
+    ordered = sorted(values)
+    return {
+        **summary,
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": round(_percentile(ordered, 50), 3),
+        "p95_ms": round(_percentile(ordered, 95), 3),
+        "p99_ms": round(_percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    # Nearest-rank percentile on pre-sorted values.
+    rank = max(1, int(round(len(ordered) * pct / 100.0)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    defaults = BenchConfig()
+    parser.add_argument("--cars", type=int, default=defaults.cars)
+    parser.add_argument("--customers", type=int, default=defaults.customers)
+    parser.add_argument("--history-years", type=int, default=defaults.history_years)
+    parser.add_argument("--bookings-per-car-year", type=int, default=defaults.bookings_per_car_year)
+    parser.add_argument("--operations", type=int, default=defaults.operations)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--sharded", action="store_true", help="use per-location shard files")
+    parser.add_argument("--db", default=None, help="database path (default: a fresh temp dir)")
+    parser.add_argument("--output", default=None, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    config = BenchConfig(
+        cars=args.cars,
+        customers=args.customers,
+        history_years=args.history_years,
+        bookings_per_car_year=args.bookings_per_car_year,
+        operations=args.operations,
+        seed=args.seed,
+        sharded=args.sharded,
+    )
+    if args.db is not None:
+        if Path(args.db).exists():
+            parser.error("--db must not exist yet (the benchmark seeds a fresh database)")
+        report = run(config, Path(args.db))
+    else:
+        with tempfile.TemporaryDirectory(prefix="car-rental-bench-") as tmp_dir:
+            report = run(config, Path(tmp_dir) / "app.db")
+            sqlite_base.close_all()
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
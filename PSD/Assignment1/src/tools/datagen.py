@@ -0,0 +1,338 @@
+"""Deterministic synthetic data generator for scale testing."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import hashlib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.models.booking import BookingStatus
+from src.models.car import CarCategory, CarStatus
+from src.models.user import UserRole, UserStatus
+from src.repositories import sharding, sqlite_base, statements
+
+# Rows are generated as plain tuples in schema column order and streamed into
+# SQLite with executemany, one transaction per batch. Model objects are not
+# built (no validate()/to_dict()), and ids are derived from (seed, kind, index)
+# so nothing has to be held in memory to pick a random user for a booking.
+
+_LOCATIONS = ["Auckland", "Wellington", "Christchurch", "Queenstown", "Hamilton", "Dunedin"]
+_MAKES = [
+    ("Toyota", "Corolla"),
+    ("Toyota", "RAV4"),
+    ("Mazda", "CX-5"),
+    ("Ford", "Ranger"),
+    ("Tesla", "Model 3"),
+    ("Kia", "Carnival"),
+    ("Suzuki", "Swift"),
+]
+_CATEGORY_RATES = {
+    CarCategory.ECONOMY: (40, 70),
+    CarCategory.COMPACT: (55, 85),
+    CarCategory.SUV: (80, 140),
+    CarCategory.LUXURY: (150, 320),
+    CarCategory.VAN: (90, 160),
+}
+_INSURANCE_FEES = {"none": 0, "basic": 15, "premium": 30}
+_LATE_FEE_PER_DAY = "20.00"
+
+_SQL_INSERT_USER = statements.register(
+    "datagen.insert_user",
+    """
+    INSERT INTO users (
+        id, role, name, email, email_normalized, phone, driver_license_no, status,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+)
+_SQL_INSERT_CAR = statements.register(
+    "datagen.insert_car",
+    """
+    INSERT INTO cars (
+        id, plate_no, make, model, year, category, daily_rate, deposit,
+        available_now, min_rent_days, max_rent_days, status, mileage, location,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+)
+_SQL_INSERT_BOOKING = statements.register(
+    "datagen.insert_booking",
+    """
+    INSERT INTO bookings (
+        id, user_id, car_id, start_date, end_date, status, pickup_time, return_time,
+        base_daily_rate, addons, insurance_plan, insurance_daily_fee, late_fee_per_day,
+        total_estimated, total_final, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+)
+_SQL_INSERT_DIRECTORY = statements.register(
+    "datagen.insert_directory", "INSERT INTO shard_directory (kind, key, shard) VALUES (?, ?, ?)"
+)
+
+
+@dataclass
+class GenConfig:
+    users: int = 10_000
+    cars: int = 1_000
+    bookings: int = 100_000
+    years: int = 3
+    seed: int = 42
+    batch_size: int = 10_000
+
+
+@dataclass
+class _CarInfo:
+    id: str
+    daily_rate: int
+    max_rent_days: int
+    shard: Optional[str]
+
+
+class _BatchWriter:
+    """Buffers rows per database and flushes each full batch in one transaction."""
+
+    def __init__(self, sql: str, batch_size: int) -> None:
+        self._sql = sql
+        self._batch_size = batch_size
+        self._buffers: Dict[Optional[str], List[Sequence[object]]] = {}
+        self.written = 0
+
+    def add(self, row: Sequence[object], shard: Optional[str] = None) -> None:
+        buffer = self._buffers.setdefault(shard, [])
+        buffer.append(row)
+        if len(buffer) >= self._batch_size:
+            self._flush(shard)
+
+    def close(self) -> None:
+        for shard in list(self._buffers):
+            self._flush(shard)
+
+    def _flush(self, shard: Optional[str]) -> None:
+        rows = self._buffers.get(shard)
+        if not rows:
+            return
+        sqlite_base.init_db(shard)
+        sqlite_base.executemany(self._sql, rows, shard=shard)
+        self.written += len(rows)
+        self._buffers[shard] = []
+
+
+def generate(config: GenConfig) -> Dict[str, int]:
+    """Write users, cars and bookings into the current database (and shards)."""
+    sqlite_base.init_db()
+    rng = random.Random(config.seed)
+    today = date.today()
+
+    users = _BatchWriter(_SQL_INSERT_USER, config.batch_size)
+    for row in iter_user_rows(config, rng, today):
+        users.add(row)
+    users.close()
+
+    cars = _BatchWriter(_SQL_INSERT_CAR, config.batch_size)
+    directory = _BatchWriter(_SQL_INSERT_DIRECTORY, config.batch_size)
+    fleet: List[_CarInfo] = []
+    for row in iter_car_rows(config, rng, today):
+        shard = sharding.shard_for_location(str(row[13]))
+        cars.add(row, shard)
+        if shard is not None:
+            directory.add(("car", row[0], shard))
+            directory.add(("plate", row[1], shard))
+        fleet.append(
+            _CarInfo(id=str(row[0]), daily_rate=int(str(row[6])), max_rent_days=int(str(row[10])), shard=shard)
+        )
+    cars.close()
+
+    bookings = _BatchWriter(_SQL_INSERT_BOOKING, config.batch_size)
+    for row, shard in iter_booking_rows(config, rng, today, fleet):
+        bookings.add(row, shard)
+        if shard is not None:
+            directory.add(("booking", row[0], shard))
+    bookings.close()
+    directory.close()
+
+    return {"users": users.written, "cars": cars.written, "bookings": bookings.written}
+
+
+def iter_user_rows(config: GenConfig, rng: random.Random, today: date) -> Iterator[Tuple[object, ...]]:
+    for idx in range(config.users):
+        created = _iso_dt(today - timedelta(days=rng.randint(0, 365 * config.years)), rng)
+        yield (
+            _det_id(config.seed, "user", idx),
+            UserRole.CUSTOMER.value,
+            f"User {idx}",
+            f"user{idx}@example.com",
+            f"user{idx}@example.com",
+            f"+64 21 {rng.randint(1000000, 9999999)}" if rng.random() < 0.7 else None,
+            f"NZ{idx:08d}",
+            UserStatus.SUSPENDED.value if rng.random() < 0.01 else UserStatus.ACTIVE.value,
+            created,
+            created,
+        )
+
+
+def iter_car_rows(config: GenConfig, rng: random.Random, today: date) -> Iterator[Tuple[object, ...]]:
+    categories = list(_CATEGORY_RATES)
+    for idx in range(config.cars):
+        category = rng.choice(categories)
+        low, high = _CATEGORY_RATES[category]
+        make, model = rng.choice(_MAKES)
+        created = _iso_dt(today - timedelta(days=365 * config.years + rng.randint(0, 90)), rng)
+        status = CarStatus.ACTIVE if rng.random() < 0.95 else rng.choice([CarStatus.MAINTENANCE, CarStatus.RETIRED])
+        yield (
+            _det_id(config.seed, "car", idx),
+            f"GEN{idx:07d}",
+            make,
+            model,
+            rng.randint(2012, today.year),
+            category.value,
+            str(rng.randint(low, high)),
+            str(rng.choice([0, 100, 250, 500])),
+            1,
+            1,
+            rng.choice([7, 14, 30]),
+            status.value,
+            rng.randint(0, 250_000),
+            rng.choice(_LOCATIONS),
+            created,
+            created,
+        )
+
+
+def iter_booking_rows(
+    config: GenConfig, rng: random.Random, today: date, fleet: List[_CarInfo]
+) -> Iterator[Tuple[Tuple[object, ...], Optional[str]]]:
+    """Yield non-overlapping bookings per car across the history window."""
+    if not fleet or config.users == 0:
+        return
+    per_car, remainder = divmod(config.bookings, len(fleet))
+    # Spread each car's bookings evenly from `years` ago until two months ahead.
+    window_days = 365 * config.years + 60
+    window_start = today - timedelta(days=365 * config.years)
+    idx = 0
+    for car_pos, car in enumerate(fleet):
+        count = per_car + (1 if car_pos < remainder else 0)
+        if count == 0:
+            continue
+        # Each booking gets its own slot of the window, so a car never double-books.
+        span = max(window_days, count)
+        for n in range(count):
+            slot_start = n * span // count
+            slot_len = (n + 1) * span // count - slot_start
+            days = rng.randint(1, min(car.max_rent_days, slot_len))
+            start = window_start + timedelta(days=slot_start + rng.randint(0, slot_len - days))
+            end = start + timedelta(days=days)
+            yield _booking_row(config, rng, today, car, idx, start, end), car.shard
+            idx += 1
+
+
+def _booking_row(
+    config: GenConfig, rng: random.Random, today: date, car: _CarInfo, idx: int, start: date, end: date
+) -> Tuple[object, ...]:
+    days = (end - start).days
+    plan = rng.choice(list(_INSURANCE_FEES))
+    addon = 5 if rng.random() < 0.3 else 0
+    estimated = days * (car.daily_rate + _INSURANCE_FEES[plan] + addon)
+
+    pickup_time = None
+    return_time = None
+    total_final = None
+    if end < today:
+        roll = rng.random()
+        status = BookingStatus.COMPLETED if roll < 0.85 else (
+            BookingStatus.CANCELLED if roll < 0.95 else BookingStatus.REJECTED
+        )
+        if status == BookingStatus.COMPLETED:
+            pickup_time = _iso_dt(start, rng)
+            return_time = _iso_dt(end, rng)
+            total_final = f"{estimated}.00"
+    elif start <= today:
+        status = BookingStatus.ACTIVE
+        pickup_time = _iso_dt(start, rng)
+    else:
+        status = BookingStatus.APPROVED if rng.random() < 0.6 else BookingStatus.PENDING
+
+    created = _iso_dt(start - timedelta(days=rng.randint(1, 30)), rng)
+    return (
+        _det_id(config.seed, "booking", idx),
+        _det_id(config.seed, "user", rng.randrange(config.users)),
+        car.id,
+        start.isoformat(),
+        end.isoformat(),
+        status.value,
+        pickup_time,
+        return_time,
+        str(car.daily_rate),
+        json.dumps({"gps": "5.00"}) if addon else "{}",
+        plan,
+        f"{_INSURANCE_FEES[plan]}.00",
+        _LATE_FEE_PER_DAY,
+        f"{estimated}.00",
+        total_final,
+        created,
+        created,
+    )
+
+
+def _det_id(seed: int, kind: str, idx: int) -> str:
+    digest = hashlib.blake2b(f"{seed}:{kind}:{idx}".encode("ascii"), digest_size=16).digest()
+    return str(UUID(bytes=digest, version=4))
+
+
+def _iso_dt(day: date, rng: random.Random) -> str:
+    moment = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(
+        seconds=rng.randint(8 * 3600, 18 * 3600)
+    )
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    defaults = GenConfig()
+    parser.add_argument("--db", required=True, help="path of a new main database file")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--cars", type=int, default=defaults.cars)
+    parser.add_argument("--bookings", type=int, default=defaults.bookings)
+    parser.add_argument("--years", type=int, default=defaults.years)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--sharded", action="store_true", help="write cars/bookings to location shards")
+    args = parser.parse_args(argv)
+
+    if Path(args.db).exists():
+        parser.error("--db must not exist yet (generated ids are deterministic)")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+
+    sqlite_base.use_database(args.db)
+    sharding.set_enabled(args.sharded)
+    # Whole-batch inserts are expected to exceed the per-query slow log threshold.
+    statements.set_slow_query_threshold(float("inf"))
+    config = GenConfig(
+        users=args.users,
+        cars=args.cars,
+        bookings=args.bookings,
+        years=args.years,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+    started = time.perf_counter()
+    counts = generate(config)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(
+        f"Generated {counts['users']} users, {counts['cars']} cars, {counts['bookings']} bookings "
+        f"in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Dump EXPLAIN QUERY PLAN for registered SQL statements."""
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional
+
+# Importing the repositories registers their statements.
+from src.repositories import audit_repo, booking_repo, car_repo, outbox_repo, sharding, user_repo  # noqa: F401
+from src.repositories import statements
+from src.repositories.sqlite_base import get_connection, init_db
+
+
+def explain(name: str, shard: Optional[str] = None) -> List[str]:
+    """Return the query plan lines for one registered statement."""
+    sql = statements.registered().get(name)
+    if sql is None:
+        raise ValueError(f"unknown statement: {name}")
+    init_db(shard)
+    # Placeholders only need a value of the right count for planning.
+    params = [None] * sql.count("?")
+    rows = get_connection(shard).execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [str(row["detail"]) for row in rows]
+
+
+def dump_plans(names: Optional[List[str]] = None, shard: Optional[str] = None) -> str:
+    lines: List[str] = []
+    for name in sorted(names or statements.registered()):
+        lines.append(f"== {name}")
+        lines.extend(f"   {detail}" for detail in explain(name, shard))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", help="statement names (default: all)")
+    parser.add_argument("--shard", default=None, help="shard database to plan against")
+    args = parser.parse_args(argv)
+    print(dump_plans(args.names, args.shard))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+
+from factory import NotificationFactory
+
+
+class RateLimiter:
+    # Token bucket: at most `rate` messages per second, bursts up to `burst`.
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, count: int = 1):
+        # Reserve the tokens now (possibly going into debt) and sleep off the debt,
+        # so concurrent workers queue up fairly instead of spinning.
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= count
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DispatchStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sent = {}
+        self.failed = {}
+        self.retries = {}
+
+    def add(self, counter: dict, channel: str, count: int):
+        with self.lock:
+            counter[channel] = counter.get(channel, 0) + count
+
+    def summary(self) -> dict:
+        with self.lock:
+            return {"sent": dict(self.sent), "failed": dict(self.failed), "retries": dict(self.retries)}
+
+
+class NotificationDispatcher:
+    """Queue notifications and send them in per-channel batches on a worker pool.
+
+    submit() only enqueues, so callers never wait on a provider. A collector
+    thread groups messages by channel and hands a batch to the pool once it is
+    full or `max_wait` seconds old. Failed batches are retried with
+    exponential backoff; channels in `rate_limits` are throttled to that many
+    messages per second.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        workers: int = 4,
+        batch_size: int = 100,
+        max_wait: float = 0.05,
+        max_retries: int = 3,
+        backoff: float = 0.1,
+        rate_limits: dict[str, float] | None = None,
+        transport_options: dict | None = None,
+    ):
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = DispatchStats()
+        self.dead_letters = []
+        self._limiters = {channel: RateLimiter(rate) for channel, rate in (rate_limits or {}).items()}
+        self._transport_options = transport_options or {}
+        self._transports = {}
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._oldest = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify")
+        self._closed = False
+        self._collector = threading.Thread(target=self._collect, name="notify-collector", daemon=True)
+        self._collector.start()
+
+    def submit(self, notification_type: str, message: str):
+        if self._closed:
+            raise RuntimeError("dispatcher is closed")
+        self._transport(notification_type)  # Reject unknown channels at the call site.
+        self._queue.put((notification_type, message))
+
+    def close(self):
+        # Send everything already submitted, then stop the collector and the pool.
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._collector.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _transport(self, channel: str):
+        with self._lock:
+            transport = self._transports.get(channel)
+            if transport is None:
+                transport = NotificationFactory.create_notification(channel, **self._transport_options)
+                self._transports[channel] = transport
+            return transport
+
+    def _collect(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.max_wait)
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                for channel in list(self._pending):
+                    self._flush(channel)
+                return
+            if item is not None:
+                channel, message = item
+                batch = self._pending.setdefault(channel, [])
+                if not batch:
+                    self._oldest[channel] = time.monotonic()
+                batch.append(message)
+                if len(batch) >= self.batch_size:
+                    self._flush(channel)
+            now = time.monotonic()
+            for channel in list(self._pending):
+                if now - self._oldest[channel] >= self.max_wait:
+                    self._flush(channel)
+
+    def _flush(self, channel: str):
+        batch = self._pending.pop(channel, None)
+        self._oldest.pop(channel, None)
+        if batch:
+            self._executor.submit(self._send, channel, batch)
+
+    def _send(self, channel: str, batch: list[str]):
+        transport = self._transport(channel)
+        limiter = self._limiters.get(channel)
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire(len(batch))
+            try:
+                transport.send_batch(batch)
+            except Exception as exc:
+                if attempt == self.max_retries:
+                    self.stats.add(self.stats.failed, channel, len(batch))
+                    self.dead_letters.append((channel, batch, str(exc)))
+                    return
+                self.stats.add(self.stats.retries, channel, 1)
+                time.sleep(self.backoff * (2 ** attempt))
+            else:
+                self.stats.add(self.stats.sent, channel, len(batch))
+                return
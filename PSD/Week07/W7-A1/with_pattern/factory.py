@@ -2,12 +2,12 @@ from notification import EmailNotification, SMSNotification, PushNotification
 
 class NotificationFactory:
     @staticmethod
-    def create_notification(notification_type: str):
+    def create_notification(notification_type: str, **options):
         if notification_type == "email":
-            return EmailNotification()
+            return EmailNotification(**options)
         elif notification_type == "sms":
-            return SMSNotification()
+            return SMSNotification(**options)
         elif notification_type == "push":
-            return PushNotification()
+            return PushNotification(**options)
         else:
             raise ValueError("Invalid notification type")
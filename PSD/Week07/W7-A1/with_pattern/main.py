@@ -1,3 +1,7 @@
+import sys
+import time
+
+from dispatcher import NotificationDispatcher
 from factory import NotificationFactory
 
 def main():
@@ -5,5 +9,24 @@ def main():
     notification = NotificationFactory.create_notification(notification_type)
     notification.send("Hello! This is a Factory Pattern example.")
 
+def send_booking_confirmations(count: int):
+    # Bulk demo: queue confirmations on every channel; SMS is rate limited.
+    started = time.perf_counter()
+    dispatcher = NotificationDispatcher(
+        workers=8,
+        batch_size=200,
+        rate_limits={"sms": 2000},
+        transport_options={"latency": 0.05, "failure_rate": 0.1},
+    )
+    with dispatcher:
+        for customer in range(count):
+            for channel in ("email", "sms", "push"):
+                dispatcher.submit(channel, f"Booking #{customer} confirmed")
+        print(f"Queued {count * 3} notifications in {time.perf_counter() - started:.3f}s")
+    print(f"Finished in {time.perf_counter() - started:.3f}s: {dispatcher.stats.summary()}")
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "--bulk":
+        send_booking_confirmations(int(sys.argv[2]))
+    else:
+        main()
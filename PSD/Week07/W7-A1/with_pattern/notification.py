@@ -1,18 +1,62 @@
 from abc import ABC, abstractmethod
+import random
+import time
+
+
+class TransportError(Exception):
+    pass
+
 
 class Notification(ABC):
+    channel = ""
+
     @abstractmethod
     def send(self, message: str):
         pass
 
-class EmailNotification(Notification):
-    def send(self, message: str):
-        print(f"📧 Email sent: {message}")
+    def send_batch(self, messages: list[str]):
+        for message in messages:
+            self.send(message)
 
-class SMSNotification(Notification):
-    def send(self, message: str):
-        print(f"📱 SMS sent: {message}")
 
-class PushNotification(Notification):
+class StubNotification(Notification):
+    # Local stand-in for a real provider: optional latency and random failures.
+    icon = ""
+    label = ""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+
     def send(self, message: str):
-        print(f"🔔 Push notification sent: {message}")
+        self._call_provider()
+        print(f"{self.icon} {self.label} sent: {message}")
+
+    def send_batch(self, messages: list[str]):
+        # One provider call per batch, like a bulk API.
+        self._call_provider()
+        print(f"{self.icon} {self.label} batch sent: {len(messages)} messages")
+
+    def _call_provider(self):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise TransportError(f"{self.channel} provider unavailable")
+
+
+class EmailNotification(StubNotification):
+    channel = "email"
+    icon = "📧"
+    label = "Email"
+
+
+class SMSNotification(StubNotification):
+    channel = "sms"
+    icon = "📱"
+    label = "SMS"
+
+
+class PushNotification(StubNotification):
+    channel = "push"
+    icon = "🔔"
+    label = "Push notification"
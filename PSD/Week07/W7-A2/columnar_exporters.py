@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from itertools import islice
+import json
+from typing import Any, Iterable, Iterator
+
+from exporters import DataExporter
+
+# pyarrow is optional: without it the factory falls back to JSON Lines.
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+PYARROW_AVAILABLE = pa is not None
+
+# Rows buffered per record batch (and per Parquet row group).
+DEFAULT_BATCH_ROWS = 65_536
+
+
+class ColumnarExporter(DataExporter):
+    # Records are converted to Arrow record batches of `batch_rows` rows, so memory
+    # stays bounded by one batch. The schema is inferred from the first batch.
+
+    def __init__(self, batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is required for columnar export")
+        self.batch_rows = batch_rows
+
+    def export_iter(self, records: Iterable[dict[str, Any]], output_path: str) -> int:
+        batches = self._batches(records)
+        first = next(batches, None)
+        if first is None:
+            first = pa.RecordBatch.from_pylist([])
+        writer = self.open_writer(output_path, first.schema)
+        count = 0
+        try:
+            for batch in _chain_first(first, batches):
+                writer.write_batch(batch)
+                count += batch.num_rows
+        finally:
+            writer.close()
+        return count
+
+    def open_writer(self, output_path: str, schema: "pa.Schema") -> Any:
+        raise NotImplementedError
+
+    def _batches(self, records: Iterable[dict[str, Any]]) -> Iterator["pa.RecordBatch"]:
+        # The writer's schema is fixed by the first batch: its columns are the
+        # keys seen in any of its rows, typed from their values. A column with
+        # no values yet (its type is or contains null, e.g. only empty lists) is
+        # stored as strings: JSON text for non-string values.
+        # Later batches must fit that schema. The only conversions are lossless
+        # (int into a float column, decimals, nested types); a new key or any
+        # other type change raises ValueError naming the column.
+        iterator = iter(records)
+        schema = None
+        untyped: set[str] = set()
+        while True:
+            rows = list(islice(iterator, self.batch_rows))
+            if not rows:
+                return
+            names = list(dict.fromkeys(key for row in rows for key in row))
+            if schema is None:
+                inferred = [_infer_column(name, [row.get(name) for row in rows]) for name in names]
+                untyped = {name for name, array in zip(names, inferred) if _contains_null_type(array.type)}
+                schema = pa.schema(
+                    pa.field(name, pa.string() if name in untyped else array.type)
+                    for name, array in zip(names, inferred)
+                )
+            else:
+                for name in names:
+                    if schema.get_field_index(name) < 0:
+                        raise ValueError(
+                            f"column {name!r} first appears after the first batch of "
+                            f"{self.batch_rows} rows, which fixes the output columns"
+                        )
+            columns = [
+                _fit_column(field, [row.get(field.name) for row in rows], field.name in untyped) for field in schema
+            ]
+            yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+class ParquetExporter(ColumnarExporter):
+    file_extension = "parquet"
+
+    def __init__(self, batch_rows: int = DEFAULT_BATCH_ROWS, compression: str = "snappy") -> None:
+        super().__init__(batch_rows)
+        self.compression = compression
+
+    def open_writer(self, output_path: str, schema: "pa.Schema") -> Any:
+        return pq.ParquetWriter(output_path, schema, compression=self.compression)
+
+
+class ArrowIpcExporter(ColumnarExporter):
+    # Arrow IPC file format (Feather v2): memory-mappable, no decode step on load.
+    file_extension = "arrow"
+
+    def open_writer(self, output_path: str, schema: "pa.Schema") -> Any:
+        return pa_ipc.new_file(output_path, schema)
+
+
+def _chain_first(first: "pa.RecordBatch", rest: Iterator["pa.RecordBatch"]) -> Iterator["pa.RecordBatch"]:
+    yield first
+    yield from rest
+
+
+def _infer_column(name: str, values: list[Any]) -> "pa.Array":
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+        raise ValueError(f"column {name!r} has values of incompatible types: {exc}") from exc
+
+
+def _contains_null_type(data_type: "pa.DataType") -> bool:
+    if pa.types.is_null(data_type):
+        return True
+    if pa.types.is_struct(data_type):
+        return any(_contains_null_type(data_type.field(index).type) for index in range(data_type.num_fields))
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type) or pa.types.is_fixed_size_list(data_type):
+        return _contains_null_type(data_type.value_type)
+    return False
+
+
+def _fit_column(field: "pa.Field", values: list[Any], untyped: bool) -> "pa.Array":
+    if untyped:
+        text = [
+            value if value is None or isinstance(value, str) else json.dumps(value, default=str) for value in values
+        ]
+        return pa.array(text, type=pa.string())
+    array = _infer_column(field.name, values)
+    target = field.type
+    if array.type == target:
+        return array
+    widening = (
+        pa.types.is_null(array.type)
+        or (pa.types.is_integer(array.type) and pa.types.is_floating(target))
+        or (pa.types.is_decimal(array.type) and pa.types.is_decimal(target))
+        or (pa.types.is_nested(array.type) and pa.types.is_nested(target))
+    )
+    if widening:
+        try:
+            # safe=True refuses any cast that would lose information.
+            return array.cast(target, safe=True)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    raise ValueError(
+        f"column {field.name!r} has type {array.type} in a later batch, "
+        f"but the first batch fixed it as {target}"
+    )
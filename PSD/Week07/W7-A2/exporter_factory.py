@@ -1,16 +1,49 @@
-from exporters import CsvExporter, JsonExporter, XmlExporter, DataExporter
+from __future__ import annotations
+
+from typing import Callable
+import warnings
+
+from columnar_exporters import PYARROW_AVAILABLE, ArrowIpcExporter, ParquetExporter
+from exporters import CsvExporter, JsonExporter, JsonLinesExporter, XmlExporter, DataExporter
 
 
 class ExporterFactory:
-    @staticmethod
-    def create_exporter(format_name: str) -> DataExporter:
-        format_name = format_name.lower()
-
-        if format_name == "csv":
-            return CsvExporter()
-        if format_name == "json":
-            return JsonExporter()
-        if format_name == "xml":
-            return XmlExporter()
-
-        raise ValueError("Invalid export format")
+    # Plugin registry: format name -> zero-argument callable returning an exporter.
+    _registry: dict[str, Callable[[], DataExporter]] = {}
+
+    @classmethod
+    def register(cls, format_name: str, creator: Callable[[], DataExporter]) -> None:
+        cls._registry[format_name.lower()] = creator
+
+    @classmethod
+    def formats(cls) -> list[str]:
+        return sorted(cls._registry)
+
+    @classmethod
+    def create_exporter(cls, format_name: str) -> DataExporter:
+        creator = cls._registry.get(format_name.lower())
+        if creator is None:
+            raise ValueError("Invalid export format")
+        return creator()
+
+
+def _columnar_or_jsonl(exporter_class: type[DataExporter]) -> Callable[[], DataExporter]:
+    def create() -> DataExporter:
+        if PYARROW_AVAILABLE:
+            return exporter_class()
+        warnings.warn(
+            f"pyarrow is not installed; writing JSON Lines instead of {exporter_class.file_extension}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return JsonLinesExporter()
+
+    return create
+
+
+ExporterFactory.register("csv", CsvExporter)
+ExporterFactory.register("json", JsonExporter)
+ExporterFactory.register("xml", XmlExporter)
+ExporterFactory.register("jsonl", JsonLinesExporter)
+ExporterFactory.register("parquet", _columnar_or_jsonl(ParquetExporter))
+ExporterFactory.register("arrow", _columnar_or_jsonl(ArrowIpcExporter))
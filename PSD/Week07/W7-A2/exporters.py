@@ -2,45 +2,141 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import csv
+from itertools import chain
 import json
 import xml.etree.ElementTree as ET
-from typing import Any, Iterable
+from typing import Any, Iterable, TextIO
+
+# Reused across records: json.dumps with non-default options builds a new encoder per call.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
 
 
 class DataExporter(ABC):
-    @abstractmethod
+    # Exporters consume records one at a time, so any iterable works: a list,
+    # a generator, or a database cursor with millions of rows.
+    file_extension = ""
+
     def export(self, data: list[dict[str, Any]], output_path: str) -> None:
+        self.export_iter(data, output_path)
+
+    @abstractmethod
+    def export_iter(self, records: Iterable[dict[str, Any]], output_path: str) -> int:
+        """Write records to output_path and return how many were written."""
         raise NotImplementedError
 
 
-class CsvExporter(DataExporter):
-    def export(self, data: list[dict[str, Any]], output_path: str) -> None:
-        if not data:
-            # Write an empty file if there is no data.
-            open(output_path, "w", encoding="utf-8").close()
-            return
+class TextExporter(DataExporter):
+    # Text output is header + records + footer. write_records only needs to know
+    # whether any record came before it, so a large export can be encoded as
+    # independent chunks (see parallel_export.py) and still match write().
 
-        fieldnames = list(data[0].keys())
+    def export_iter(self, records: Iterable[dict[str, Any]], output_path: str) -> int:
         with open(output_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            return self.write(records, file)
+
+    def write(self, records: Iterable[dict[str, Any]], file: TextIO) -> int:
+        """Stream records to an open text file and return how many were written."""
+        self.write_header(file)
+        count = self.write_records(records, file, first=True)
+        self.write_footer(file, count)
+        return count
+
+    def prepare(self, first_record: dict[str, Any]) -> "TextExporter":
+        # Returns an exporter with format-wide state (the CSV header) fixed from
+        # the first record, for encoding chunks separately. self is not changed.
+        return self
+
+    def write_header(self, file: TextIO) -> None:
+        pass
+
+    @abstractmethod
+    def write_records(self, records: Iterable[dict[str, Any]], file: TextIO, first: bool) -> int:
+        """Write records; first=True means no record has been written before them."""
+        raise NotImplementedError
+
+    def write_footer(self, file: TextIO, count: int) -> None:
+        pass
+
+
+class CsvExporter(TextExporter):
+    file_extension = "csv"
+
+    def __init__(self, fieldnames: list[str] | None = None) -> None:
+        self.fieldnames = fieldnames
+
+    def prepare(self, first_record: dict[str, Any]) -> "CsvExporter":
+        if self.fieldnames is not None:
+            return self
+        return CsvExporter(list(first_record.keys()))
+
+    def write_records(self, records: Iterable[dict[str, Any]], file: TextIO, first: bool) -> int:
+        iterator = iter(records)
+        head = next(iterator, None)
+        if head is None:
+            # Write an empty file if there is no data.
+            return 0
+
+        # The header comes from the first record of each export unless it was pinned.
+        fieldnames = self.fieldnames if self.fieldnames is not None else list(head.keys())
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        if first:
             writer.writeheader()
-            writer.writerows(data)
+        count = 0
+        for record in chain([head], iterator):
+            writer.writerow(record)
+            count += 1
+        return count
 
 
-class JsonExporter(DataExporter):
-    def export(self, data: list[dict[str, Any]], output_path: str) -> None:
-        with open(output_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2)
+class JsonExporter(TextExporter):
+    file_extension = "json"
 
+    def write_records(self, records: Iterable[dict[str, Any]], file: TextIO, first: bool) -> int:
+        # Same layout as json.dump(data, indent=2), one record at a time.
+        count = 0
+        for record in records:
+            file.write("[\n" if first and count == 0 else ",\n")
+            text = json.dumps(record, indent=2)
+            file.write("\n".join("  " + line for line in text.splitlines()))
+            count += 1
+        return count
 
-class XmlExporter(DataExporter):
-    def export(self, data: list[dict[str, Any]], output_path: str) -> None:
-        root = ET.Element("records")
-        for record in data:
-            record_elem = ET.SubElement(root, "record")
+    def write_footer(self, file: TextIO, count: int) -> None:
+        file.write("\n]" if count else "[]")
+
+
+class XmlExporter(TextExporter):
+    file_extension = "xml"
+
+    def write_header(self, file: TextIO) -> None:
+        file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+
+    def write_records(self, records: Iterable[dict[str, Any]], file: TextIO, first: bool) -> int:
+        # Only one <record> element exists at a time; output matches ElementTree.write.
+        count = 0
+        for record in records:
+            if first and count == 0:
+                file.write("<records>")
+            record_elem = ET.Element("record")
             for key, value in record.items():
                 child = ET.SubElement(record_elem, str(key))
                 child.text = str(value)
+            file.write(ET.tostring(record_elem, encoding="unicode"))
+            count += 1
+        return count
+
+    def write_footer(self, file: TextIO, count: int) -> None:
+        file.write("</records>" if count else "<records />")
+
+
+class JsonLinesExporter(TextExporter):
+    file_extension = "jsonl"
 
-        tree = ET.ElementTree(root)
-        tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    def write_records(self, records: Iterable[dict[str, Any]], file: TextIO, first: bool) -> int:
+        # One compact object per line: no indentation, no spaces after separators.
+        count = 0
+        for record in records:
+            file.write(_COMPACT_JSON.encode(record))
+            file.write("\n")
+            count += 1
+        return count
@@ -1,28 +1,74 @@
-import json
+from __future__ import annotations
+
+import argparse
 import os
+from typing import Iterator
 
 from exporter_factory import ExporterFactory
+from parallel_export import DEFAULT_CHUNK_ROWS, ParallelExporter
+from readers import iter_records
 
 DATA_FILE = "data.json"
 OUTPUT_DIR = "output"
 
 
-def load_data(path: str) -> list[dict]:
-    with open(path, "r", encoding="utf-8") as file:
-        return json.load(file)
+def load_data(path: str, fields: list[str] | None = None, types: dict[str, str] | None = None) -> Iterator[dict]:
+    # Streams records (JSON array or JSON Lines); nothing is read until the exporter pulls.
+    return iter_records(path, fields=fields, types=types)
+
+
+def type_spec(spec: str) -> tuple[str, str]:
+    field, sep, kind = spec.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected FIELD:TYPE, got {spec!r}")
+    return field, kind
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export data.json to another format.")
+    parser.add_argument("--format", help="export format (asked interactively if omitted)")
+    parser.add_argument("--input", default=DATA_FILE, help="JSON array or JSON Lines file")
+    parser.add_argument("--fields", help="comma-separated fields to keep, in output order")
+    parser.add_argument(
+        "--type", action="append", type=type_spec, default=[], metavar="FIELD:TYPE", help="coerce a field (str/int/float/bool)"
+    )
+    parser.add_argument("--parallel", action="store_true", help="encode chunks on a process pool")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--compression", choices=["gzip", "zstd", "none"], default="gzip")
+    parser.add_argument("--parts", action="store_true", help="one file per chunk instead of one file")
+    return parser.parse_args()
 
 
 def main() -> None:
-    format_name = input("Choose export format (csv/json/xml): ").lower()
+    args = parse_args()
+    format_name = args.format
+    if format_name is None:
+        formats = "/".join(ExporterFactory.formats())
+        format_name = input(f"Choose export format ({formats}): ")
+    format_name = format_name.lower()
     exporter = ExporterFactory.create_exporter(format_name)
 
-    data = load_data(DATA_FILE)
+    fields = args.fields.split(",") if args.fields else None
+    data = load_data(args.input, fields=fields, types=dict(args.type))
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    output_path = os.path.join(OUTPUT_DIR, f"export.{format_name}")
-    exporter.export(data, output_path)
+    output_path = os.path.join(OUTPUT_DIR, f"export.{exporter.file_extension}")
+    if args.parallel:
+        parallel = ParallelExporter(
+            format_name,
+            chunk_rows=args.chunk_rows,
+            workers=args.workers,
+            compression=None if args.compression == "none" else args.compression,
+            mode="parts" if args.parts else "concat",
+        )
+        manifest = parallel.export_iter(data, output_path)
+        count = manifest["records"]
+        output_path = ", ".join(os.path.join(OUTPUT_DIR, entry["path"]) for entry in manifest["files"])
+    else:
+        count = exporter.export_iter(data, output_path)
 
-    print(f"Exported {len(data)} records to {output_path}")
+    print(f"Exported {count} records to {output_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+import gzip
+import hashlib
+import io
+from itertools import chain, islice
+import json
+import os
+from typing import Any, Iterable, Iterator
+
+from exporter_factory import ExporterFactory
+from exporters import DataExporter, TextExporter
+
+# zstandard is optional; gzip (stdlib) is always available.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+class ParallelExporter:
+    """Encode an export in chunks on a process pool and write compressed output.
+
+    mode="concat" writes one file: the chunks are compressed separately and
+    appended in order (gzip members / zstd frames), which standard tools read
+    as a single stream. Decompressed, it is byte-identical to the serial
+    exporter's output. mode="parts" writes one standalone file per chunk.
+
+    Output never depends on worker count or timing: chunks are written in
+    input order and gzip headers carry no timestamp. A JSON manifest with
+    per-file record counts and SHA-256 digests is written next to the output.
+    """
+
+    def __init__(
+        self,
+        format_name: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        workers: int | None = None,
+        compression: str | None = "gzip",
+        mode: str = "concat",
+        level: int | None = None,
+    ) -> None:
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError("compression must be gzip, zstd or None")
+        if compression == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard is required for zstd compression")
+        if mode not in ("concat", "parts"):
+            raise ValueError("mode must be concat or parts")
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+
+        exporter = ExporterFactory.create_exporter(format_name)
+        if not isinstance(exporter, TextExporter) and (mode == "concat" or compression):
+            # Parquet/Arrow files cannot be concatenated and already compress internally.
+            raise ValueError("columnar formats support mode='parts' without compression only")
+        self.format_name = format_name
+        self.chunk_rows = chunk_rows
+        self.workers = workers or os.cpu_count() or 1
+        self.compression = compression
+        self.mode = mode
+        self.level = level
+        self._exporter = exporter
+
+    def export_iter(self, records: Iterable[dict[str, Any]], output_path: str) -> dict[str, Any]:
+        """Export records and return the manifest (also written as <output>.manifest.json)."""
+        exporter = self._exporter
+        iterator = iter(records)
+        first = next(iterator, None)
+        if first is not None:
+            # Fix format-wide state (the CSV header) before chunks go to other processes.
+            if isinstance(exporter, TextExporter):
+                exporter = exporter.prepare(first)
+            iterator = chain([first], iterator)
+        chunks = _chunks(iterator, self.chunk_rows)
+
+        output_path = _with_suffix(output_path, COMPRESSION_SUFFIXES[self.compression])
+        if self.mode == "concat":
+            files = [self._export_concat(exporter, chunks, output_path)]
+        else:
+            files = self._export_parts(exporter, chunks, output_path)
+
+        manifest = {
+            "format": self.format_name,
+            "compression": self.compression,
+            "mode": self.mode,
+            "chunk_rows": self.chunk_rows,
+            "records": sum(entry["records"] for entry in files),
+            "files": files,
+        }
+        with open(output_path + ".manifest.json", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+        return manifest
+
+    def _export_concat(
+        self, exporter: TextExporter, chunks: Iterator[list[dict[str, Any]]], output_path: str
+    ) -> dict[str, Any]:
+        digest = hashlib.sha256()
+        size = 0
+        count = 0
+        with open(output_path, "wb") as file:
+
+            def emit(data: bytes) -> None:
+                nonlocal size
+                file.write(data)
+                digest.update(data)
+                size += len(data)
+
+            header = io.StringIO()
+            exporter.write_header(header)
+            if header.getvalue():
+                emit(_compress(header.getvalue().encode("utf-8"), self.compression, self.level))
+
+            with _executor(self.workers) as executor:
+                tasks = (
+                    (_encode_chunk, exporter, rows, index == 0, self.compression, self.level)
+                    for index, rows in enumerate(chunks)
+                )
+                for data, rows_written in _ordered(executor, tasks, self.workers * 2):
+                    emit(data)
+                    count += rows_written
+
+            footer = io.StringIO()
+            exporter.write_footer(footer, count)
+            if footer.getvalue():
+                emit(_compress(footer.getvalue().encode("utf-8"), self.compression, self.level))
+
+        return {"path": os.path.basename(output_path), "records": count, "bytes": size, "sha256": digest.hexdigest()}
+
+    def _export_parts(
+        self, exporter: DataExporter, chunks: Iterator[list[dict[str, Any]]], output_path: str
+    ) -> list[dict[str, Any]]:
+        suffix = COMPRESSION_SUFFIXES[self.compression]
+        base = output_path[: -len(suffix)] if suffix else output_path
+        stem, ext = os.path.splitext(base)
+        files = []
+        with _executor(self.workers) as executor:
+            tasks = (
+                (
+                    _write_part,
+                    exporter,
+                    rows,
+                    f"{stem}.part-{index:05d}{ext}{suffix}",
+                    self.compression,
+                    self.level,
+                )
+                for index, rows in enumerate(chunks)
+            )
+            for entry in _ordered(executor, tasks, self.workers * 2):
+                files.append(entry)
+        return files
+
+
+def _encode_chunk(
+    exporter: TextExporter, rows: list[dict[str, Any]], first: bool, compression: str | None, level: int | None
+) -> tuple[bytes, int]:
+    buffer = io.StringIO()
+    count = exporter.write_records(rows, buffer, first)
+    return _compress(buffer.getvalue().encode("utf-8"), compression, level), count
+
+
+def _write_part(
+    exporter: DataExporter, rows: list[dict[str, Any]], path: str, compression: str | None, level: int | None
+) -> dict[str, Any]:
+    if isinstance(exporter, TextExporter):
+        buffer = io.StringIO()
+        count = exporter.write(rows, buffer)
+        data = _compress(buffer.getvalue().encode("utf-8"), compression, level)
+        with open(path, "wb") as file:
+            file.write(data)
+    else:
+        count = exporter.export_iter(rows, path)
+        with open(path, "rb") as file:
+            data = file.read()
+    return {
+        "path": os.path.basename(path),
+        "records": count,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def _compress(data: bytes, compression: str | None, level: int | None) -> bytes:
+    if compression == "gzip":
+        # mtime=0 keeps the bytes identical from run to run.
+        return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+    return data
+
+
+def _chunks(records: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    while True:
+        rows = list(islice(records, size))
+        if not rows:
+            return
+        yield rows
+
+
+def _ordered(executor: Executor, tasks: Iterable[tuple], window: int) -> Iterator[Any]:
+    # Like Executor.map, but only `window` chunks are in flight, so a huge input
+    # is never read (or held) all at once.
+    pending: deque[Future] = deque()
+    for task in tasks:
+        pending.append(executor.submit(*task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _InlineExecutor(Executor):
+    # workers=1: run in this process (no pickling) with the same code path.
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _executor(workers: int) -> Executor:
+    if workers <= 1:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _with_suffix(path: str, suffix: str) -> str:
+    return path if not suffix or path.endswith(suffix) else path + suffix
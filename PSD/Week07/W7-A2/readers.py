@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+# Incremental readers: records are yielded as soon as they are parsed, so the
+# export pipeline starts writing immediately and memory stays bounded by one
+# record (plus a read buffer) however large the input is.
+
+READ_CHUNK_CHARS = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+_DECODER = json.JSONDecoder()
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes"):
+            return True
+        if lowered in ("false", "0", "no", ""):
+            return False
+        raise ValueError(f"not a boolean: {value!r}")
+    return bool(value)
+
+
+COERCIONS: dict[str, Callable[[Any], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _parse_bool,
+}
+
+
+def iter_json_array(file: TextIO, chunk_chars: int = READ_CHUNK_CHARS) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array without loading the whole file."""
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        # Drop consumed text and append the next chunk; False once the file is exhausted.
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = file.read(chunk_chars)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return not eof
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            match = _NON_WHITESPACE.search(buffer, pos)
+            if match is not None:
+                pos = match.start()
+                return buffer[pos]
+            pos = len(buffer)
+            if not fill():
+                return ""
+
+    def check_end() -> None:
+        # Like json.load, only whitespace may follow the closing bracket.
+        if next_char():
+            raise ValueError("unexpected data after the JSON array")
+
+    if next_char() != "[":
+        raise ValueError("expected a JSON array")
+    pos += 1
+    if next_char() == "]":
+        pos += 1
+        check_end()
+        return
+
+    while True:
+        next_char()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element continues past the buffer (or is malformed: then fill() hits EOF).
+                if not fill():
+                    raise
+                continue
+            after = _NON_WHITESPACE.search(buffer, end)
+            if (after is None or buffer[after.start()] not in ",]") and fill():
+                # The element may have been cut short (e.g. a number); decode it again.
+                continue
+            break
+        pos = end
+        yield value
+
+        separator = next_char()
+        pos += 1
+        if separator == "]":
+            check_end()
+            return
+        if separator != ",":
+            raise ValueError("expected ',' or ']' in JSON array")
+
+
+def iter_json_lines(file: TextIO) -> Iterator[Any]:
+    """Yield one value per non-blank line (JSON Lines / NDJSON)."""
+    for line_no, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON on line {line_no}: {exc.msg}") from exc
+
+
+def iter_records(
+    path: str,
+    fields: list[str] | None = None,
+    types: dict[str, str | Callable[[Any], Any]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream records from a JSON array or JSON Lines file.
+
+    fields keeps only those keys, in that order (missing keys become None).
+    types maps a field to a coercion: "str", "int", "float", "bool" or any
+    callable. None values are left as None.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        if _is_json_lines(path, file):
+            values = iter_json_lines(file)
+        else:
+            values = iter_json_array(file)
+        yield from transform(values, fields, types)
+
+
+def transform(
+    values: Iterable[Any],
+    fields: list[str] | None = None,
+    types: dict[str, str | Callable[[Any], Any]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    converters = {field: _converter(kind) for field, kind in (types or {}).items()}
+    for index, value in enumerate(values):
+        if not isinstance(value, dict):
+            raise ValueError(f"record {index} is not a JSON object")
+        record = {field: value.get(field) for field in fields} if fields else value
+        for field, convert in converters.items():
+            if record.get(field) is None:
+                continue
+            try:
+                record[field] = convert(record[field])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"record {index}: cannot convert {field}={record[field]!r}") from exc
+        yield record
+
+
+def _converter(kind: str | Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if callable(kind):
+        return kind
+    try:
+        return COERCIONS[kind]
+    except KeyError:
+        raise ValueError(f"unknown type: {kind}") from None
+
+
+def _is_json_lines(path: str, file: TextIO) -> bool:
+    if path.endswith((".jsonl", ".ndjson")):
+        return True
+    if path.endswith(".json"):
+        return False
+    # Unknown extension: sniff the first non-blank character, then rewind.
+    while True:
+        char = file.read(1)
+        if not char or char not in _WHITESPACE:
+            break
+    file.seek(0)
+    return char != "["